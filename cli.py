@@ -4,21 +4,31 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from collections import Counter
+import re
+from collections import Counter, OrderedDict
+from contextlib import AsyncExitStack
 from itertools import cycle
 from pathlib import Path
 from typing import Dict, List, Optional
+from urllib.parse import urlparse
 
 import httpx
 
 from hotel_social_discover.checkpoint import CheckpointStore
 from hotel_social_discover.config import load_config, parse_bool
 from hotel_social_discover.fetcher import Fetcher
-from hotel_social_discover.logging_utils import configure_logging, get_logger
+from hotel_social_discover.logging_utils import configure_logging, get_logger, shutdown_logging
 from hotel_social_discover.parser import parse_social_links
 from hotel_social_discover.robots import RobotsManager
-from hotel_social_discover.storage import ResultRow, read_input_csv, write_output_csv, write_summary_json
-from hotel_social_discover.url_tools import resolve_redirects
+from hotel_social_discover.storage import (
+    ResultRow,
+    open_output_csv,
+    read_input_csv,
+    utc_now_iso,
+    write_output_row,
+    write_summary_json,
+)
+from hotel_social_discover.url_tools import HTTP2_AVAILABLE, resolve_redirects
 
 logger = get_logger(__name__)
 
@@ -33,6 +43,47 @@ SHORTENER_DOMAINS = {
     "buff.ly",
     "rebrand.ly",
 }
+# Substring pre-check so ordinary links never pay for URL parsing.
+_SHORTENER_HINTS = tuple(SHORTENER_DOMAINS)
+_HOST_RE = re.compile(r"^https?://([^/:?#]+)", re.I)
+
+# Persist the checkpoint every N written rows so a crash mid-run keeps most progress.
+CHECKPOINT_SAVE_INTERVAL = 500
+
+# Shortener expansions are shared by every hotel in the run; concurrent lookups of the
+# same short link wait on the in-flight request instead of issuing their own.
+# The cache is an LRU capped at SHORTENER_CACHE_SIZE so long runs keep memory flat.
+SHORTENER_CACHE_SIZE = 10_000
+_SHORTENER_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SHORTENER_INFLIGHT: Dict[str, asyncio.Event] = {}
+
+
+async def resolve_shortened(client: httpx.AsyncClient, link: str) -> str:
+    cached = _SHORTENER_CACHE.get(link)
+    if cached is not None:
+        _SHORTENER_CACHE.move_to_end(link)
+        return cached
+    if not any(hint in link for hint in _SHORTENER_HINTS):
+        return link
+    match = _HOST_RE.match(link)
+    domain = match.group(1).lower() if match else (urlparse(link).hostname or "")
+    if domain not in SHORTENER_DOMAINS:
+        return link
+
+    pending = _SHORTENER_INFLIGHT.get(link)
+    if pending is not None:
+        await pending.wait()
+        return _SHORTENER_CACHE.get(link, link)
+
+    event = _SHORTENER_INFLIGHT[link] = asyncio.Event()
+    try:
+        resolved = _SHORTENER_CACHE[link] = await resolve_redirects(client, link)
+        if len(_SHORTENER_CACHE) > SHORTENER_CACHE_SIZE:
+            _SHORTENER_CACHE.popitem(last=False)
+    finally:
+        del _SHORTENER_INFLIGHT[link]
+        event.set()
+    return resolved
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -61,54 +112,54 @@ async def process_hotel(
     fetcher: Fetcher,
     robots: RobotsManager,
     checkpoint: CheckpointStore,
-    proxy: Optional[str],
+    client: Optional[httpx.AsyncClient],
     force: bool,
     resume_enabled: bool,
     summary: Counter,
+    checked_at: Optional[str] = None,
 ) -> ResultRow:
     hotel_id = record.get("hotel_id") or record.get("id") or ""
     hotel_name = record.get("hotel_name") or record.get("name") or ""
     url = record.get("url") or record.get("website") or ""
 
     if not url:
-        return ResultRow(hotel_id=hotel_id, hotel_name=hotel_name, url=url, error_message="missing_url")
+        return ResultRow(
+            hotel_id=hotel_id,
+            hotel_name=hotel_name,
+            url=url,
+            error_message="missing_url",
+            last_checked_utc_iso=checked_at,
+        )
 
-    if resume_enabled and checkpoint.is_processed(url) and not force:
-        cached = checkpoint.get(url) or {}
-        summary["skipped_checkpoint"] += 1
+    if not url.lower().startswith(("http://", "https://")):
         return ResultRow(
             hotel_id=hotel_id,
             hotel_name=hotel_name,
             url=url,
-            canonical_url=cached.get("canonical_url"),
-            http_status=cached.get("http_status"),
-            response_time_ms=cached.get("response_time_ms"),
-            found_facebook=cached.get("found_facebook", False),
-            facebook_url=cached.get("facebook_url"),
-            found_instagram=cached.get("found_instagram", False),
-            instagram_url=cached.get("instagram_url"),
-            found_x=cached.get("found_x", False),
-            x_url=cached.get("x_url"),
-            found_youtube=cached.get("found_youtube", False),
-            youtube_url=cached.get("youtube_url"),
-            found_tiktok=cached.get("found_tiktok", False),
-            tiktok_url=cached.get("tiktok_url"),
-            found_linkedin=cached.get("found_linkedin", False),
-            linkedin_url=cached.get("linkedin_url"),
-            other_socials=cached.get("other_socials", []),
-            page_snapshot_path=cached.get("page_snapshot_path"),
-            error_message=cached.get("error_message"),
+            error_message="invalid_scheme",
+            last_checked_utc_iso=checked_at,
         )
 
+    if resume_enabled and checkpoint.is_processed(url) and not force:
+        cached = checkpoint.get(url) or {}
+        summary["skipped_checkpoint"] += 1
+        return ResultRow.from_dict(cached, hotel_id=hotel_id, hotel_name=hotel_name, url=url)
+
     allowed = await robots.allowed(url)
     if not allowed:
         summary["skipped_robots"] += 1
-        row = ResultRow(hotel_id=hotel_id, hotel_name=hotel_name, url=url, error_message="blocked_by_robots")
+        row = ResultRow(
+            hotel_id=hotel_id,
+            hotel_name=hotel_name,
+            url=url,
+            error_message="blocked_by_robots",
+            last_checked_utc_iso=checked_at,
+        )
         if resume_enabled:
             checkpoint.set(url, row.to_dict())
         return row
 
-    fetch_result = await fetcher.fetch(url, proxy=proxy)
+    fetch_result = await fetcher.fetch(url, client=client)
     if fetch_result.error:
         summary["errors"] += 1
         row = ResultRow(
@@ -119,6 +170,7 @@ async def process_hotel(
             http_status=fetch_result.status_code,
             response_time_ms=fetch_result.elapsed_ms,
             error_message=fetch_result.error,
+            last_checked_utc_iso=checked_at,
         )
         if resume_enabled:
             checkpoint.set(url, row.to_dict())
@@ -126,38 +178,29 @@ async def process_hotel(
 
     summary["scanned"] += 1
 
-    bucket, others = parse_social_links(fetch_result.body or "", fetch_result.final_url)
-
-    # Resolve shortened URLs
-    resolved_cache: Dict[str, str] = {}
-    async def resolve(link: str) -> str:
-        if link in resolved_cache:
-            return resolved_cache[link]
-        domain = httpx.URL(link).host or ""
-        if domain in SHORTENER_DOMAINS:
-            resolved_cache[link] = await resolve_redirects(fetcher.client, link)
-        else:
-            resolved_cache[link] = link
-        return resolved_cache[link]
-
-    facebook_urls = [await resolve(url) for url in bucket["facebook"]]
-    instagram_urls = [await resolve(url) for url in bucket["instagram"]]
-    x_urls = [await resolve(url) for url in bucket["x"]]
-    youtube_urls = [await resolve(url) for url in bucket["youtube"]]
-    tiktok_urls = [await resolve(url) for url in bucket["tiktok"]]
-    linkedin_urls = [await resolve(url) for url in bucket["linkedin"]]
-
-    for platform, items in (
-        ("facebook", facebook_urls),
-        ("instagram", instagram_urls),
-        ("x", x_urls),
-        ("youtube", youtube_urls),
-        ("tiktok", tiktok_urls),
-        ("linkedin", linkedin_urls),
-    ):
+    # Parsing is CPU-bound; keep the event loop free for other hotels' network I/O.
+    bucket, others = await asyncio.to_thread(parse_social_links, fetch_result.body or "", fetch_result.final_url)
+
+    # Resolve shortened URLs for every platform concurrently; most pages have none to resolve.
+    all_links = [(platform, link) for platform, links in bucket.items() for link in links]
+    resolved = bucket
+    if any(hint in link for _, link in all_links for hint in _SHORTENER_HINTS):
+        resolved_links = await asyncio.gather(*(resolve_shortened(fetcher.client, link) for _, link in all_links))
+        resolved = {platform: [] for platform in bucket}
+        for (platform, _), resolved_link in zip(all_links, resolved_links):
+            resolved[platform].append(resolved_link)
+
+    for platform, items in resolved.items():
         if items:
             summary[f"found_{platform}"] += len(items)
 
+    facebook_urls = resolved["facebook"]
+    instagram_urls = resolved["instagram"]
+    x_urls = resolved["x"]
+    youtube_urls = resolved["youtube"]
+    tiktok_urls = resolved["tiktok"]
+    linkedin_urls = resolved["linkedin"]
+
     row = ResultRow(
         hotel_id=hotel_id,
         hotel_name=hotel_name,
@@ -179,6 +222,7 @@ async def process_hotel(
         linkedin_url="|".join(linkedin_urls) if linkedin_urls else None,
         other_socials=others,
         page_snapshot_path=fetch_result.snapshot_path,
+        last_checked_utc_iso=checked_at,
     )
 
     if resume_enabled:
@@ -212,13 +256,31 @@ async def crawl_command(args: argparse.Namespace) -> None:
     records = read_input_csv(input_path)
     logger.info("Loaded %s records from %s", len(records), input_path)
 
-    proxy_cycle = cycle(config.proxy_list) if config.proxy_list else None
-
-    async with httpx.AsyncClient(
+    limits = httpx.Limits(
+        max_connections=config.concurrency * 4,
+        max_keepalive_connections=config.concurrency * 2,
+        keepalive_expiry=30.0,
+    )
+    client_options = dict(
         headers={"User-Agent": config.user_agent},
         follow_redirects=True,
-    ) as client:
-        robots = RobotsManager(config.user_agent, client)
+        http2=HTTP2_AVAILABLE,
+        limits=limits,
+        timeout=httpx.Timeout(config.timeout, connect=5.0),
+    )
+    async with AsyncExitStack() as stack:
+        # Opened before any crawling so a bad output path fails the run up front.
+        output_writer = stack.enter_context(open_output_csv(output_path))
+        client = await stack.enter_async_context(httpx.AsyncClient(**client_options))
+        # One pooled client per proxy so connections are reused per (proxy, host).
+        proxy_clients = [
+            await stack.enter_async_context(httpx.AsyncClient(proxy=proxy, **client_options))
+            for proxy in config.proxy_list or []
+        ]
+        proxy_client_cycle = cycle(proxy_clients) if proxy_clients else None
+
+        robots_store = CheckpointStore(config.robots_cache_path)
+        robots = RobotsManager(config.user_agent, client, store=robots_store)
         fetcher = Fetcher(
             client=client,
             timeout=config.timeout,
@@ -232,32 +294,65 @@ async def crawl_command(args: argparse.Namespace) -> None:
 
         checkpoint = CheckpointStore(config.checkpoint_path)
 
-        semaphore = asyncio.Semaphore(config.concurrency)
         summary: Counter = Counter()
-        results: List[ResultRow] = []
-
-        async def worker(record: Dict[str, str]) -> None:
-            async with semaphore:
-                proxy = next(proxy_cycle) if proxy_cycle else None
+        rows_queue: "asyncio.Queue[Optional[ResultRow]]" = asyncio.Queue(maxsize=config.concurrency * 2)
+        pending_records = iter(records)
+        # Shared by the rows of one write batch instead of a clock read and isoformat() per row; the writer
+        # refreshes it every CHECKPOINT_SAVE_INTERVAL rows so long runs stay accurate.
+        checked_at = utc_now_iso()
+        written = 0
+
+        async def worker() -> None:
+            # Workers share one iterator so only `concurrency` hotels are in flight at once.
+            for record in pending_records:
+                proxy_client = next(proxy_client_cycle) if proxy_client_cycle else None
                 row = await process_hotel(
                     record=record,
                     fetcher=fetcher,
                     robots=robots,
                     checkpoint=checkpoint,
-                    proxy=proxy,
+                    client=proxy_client,
                     force=args.force,
                     resume_enabled=resume_enabled,
                     summary=summary,
+                    checked_at=checked_at,
                 )
-                results.append(row)
-
-        await asyncio.gather(*(worker(record) for record in records))
+                await rows_queue.put(row)
+
+        async def write_rows() -> None:
+            nonlocal written, checked_at
+            while True:
+                row = await rows_queue.get()
+                if row is None:
+                    break
+                write_output_row(output_writer, row)
+                written += 1
+                if written % CHECKPOINT_SAVE_INTERVAL == 0:
+                    checked_at = utc_now_iso()
+                    if resume_enabled:
+                        checkpoint.save()
+
+        worker_tasks = [asyncio.create_task(worker()) for _ in range(config.concurrency)]
+        workers_done = asyncio.gather(*worker_tasks)
+        writer_task = asyncio.create_task(write_rows())
+        try:
+            # The writer only finishes first when it fails (e.g. disk full); the workers would then block on
+            # the full queue forever, so its error ends the run instead.
+            await asyncio.wait([workers_done, writer_task], return_when=asyncio.FIRST_COMPLETED)
+            if workers_done.done():
+                workers_done.result()
+                await rows_queue.put(None)
+            await writer_task
+        finally:
+            for task in (*worker_tasks, writer_task):
+                task.cancel()
+            await fetcher.close()
 
         if resume_enabled:
             checkpoint.save()
+        robots_store.save()
 
-    write_output_csv(output_path, results)
-    logger.info("Wrote %s rows to %s", len(results), output_path)
+    logger.info("Wrote %s rows to %s", written, output_path)
 
     summary_dict = {
         "scanned": summary.get("scanned", 0),
@@ -281,7 +376,10 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "crawl":
-        asyncio.run(crawl_command(args))
+        try:
+            asyncio.run(crawl_command(args))
+        finally:
+            shutdown_logging()
     else:
         parser.error("Unknown command")
 
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
+
 
 class CheckpointStore:
     """Simple JSON-based checkpoint store."""
@@ -15,7 +16,7 @@ class CheckpointStore:
         self._data: Dict[str, Dict] = {}
         if self.path.exists():
             try:
-                self._data = json.loads(self.path.read_text())
+                self._data = orjson.loads(self.path.read_bytes())
             except Exception:
                 self._data = {}
 
@@ -29,7 +30,9 @@ class CheckpointStore:
         self._data[key] = value
 
     def save(self) -> None:
-        self.path.write_text(json.dumps(self._data, indent=2, sort_keys=True))
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        tmp.replace(self.path)
 
 
 __all__ = ["CheckpointStore"]
@@ -21,6 +21,7 @@ class Config:
     rate_limit_per_domain: float = 2.0
     user_agent: str = "hotel-social-discover/0.1"
     checkpoint_path: Path = Path(".hotel_social_discover_checkpoint.json")
+    robots_cache_path: Path = Path(".hotel_social_discover_robots.json")
     summary_json: Path = Path("results.summary.json")
     proxy_list: Optional[List[str]] = None
 
@@ -47,6 +48,9 @@ def load_config(env_file: Optional[str] = ".env") -> Config:
         checkpoint_path=Path(
             os.getenv("HSD_CHECKPOINT_PATH", str(Config.checkpoint_path))
         ),
+        robots_cache_path=Path(
+            os.getenv("HSD_ROBOTS_CACHE_PATH", str(Config.robots_cache_path))
+        ),
         summary_json=Path(os.getenv("HSD_SUMMARY_JSON", str(Config.summary_json))),
     )
 
@@ -10,12 +10,16 @@ from typing import Optional
 from urllib.parse import urlparse
 
 import httpx
-from tenacity import AsyncRetrying, RetryError, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from .parser import is_js_heavy, looks_like_captcha
 
 logger = logging.getLogger(__name__)
 
+# Bound on per-host rate-limit state kept over a long crawl.
+MAX_TRACKED_HOSTS = 10_000
+FETCH_ATTEMPTS = 3
+SNAPSHOT_JPEG_QUALITY = 80
+
 try:  # pragma: no cover - optional heavy dependency
     from playwright.async_api import async_playwright
 except Exception:  # pragma: no cover
@@ -53,77 +57,105 @@ class Fetcher:
         self.user_agent = user_agent
         self.save_snapshots = save_snapshots
         self.snapshot_dir = snapshot_dir
-        self._locks: dict[str, asyncio.Lock] = {}
-        self._last_request: dict[str, float] = {}
+        # Earliest monotonic time the next request to each host may start, oldest host first.
+        self._next_available: dict[str, float] = {}
+        # Playwright and its browser are launched on first render and reused until close().
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
 
     async def _rate_limit(self, url: str) -> None:
-        parsed = urlparse(url)
-        host = parsed.netloc
-        lock = self._locks.setdefault(host, asyncio.Lock())
-        async with lock:
-            now = time.monotonic()
-            last = self._last_request.get(host, 0.0)
-            delta = now - last
-            if delta < self.rate_limit_per_domain:
-                await asyncio.sleep(self.rate_limit_per_domain - delta)
-            self._last_request[host] = time.monotonic()
-
-    async def fetch(self, url: str, render_hint: bool = False, proxy: Optional[str] = None) -> FetchResult:
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        # Reserve a slot without awaiting so concurrent callers never wait behind a sleeper.
+        next_available = self._next_available.pop(host, now)
+        self._next_available[host] = max(now, next_available) + self.rate_limit_per_domain
+        if len(self._next_available) > MAX_TRACKED_HOSTS:
+            del self._next_available[next(iter(self._next_available))]
+        wait = next_available - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _get(self, url: str, client: httpx.AsyncClient) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                return await client.get(url, timeout=self.timeout)
+            except httpx.HTTPError:
+                attempt += 1
+                if attempt >= FETCH_ATTEMPTS:
+                    raise
+                await asyncio.sleep(min(4, 2 ** (attempt - 1)))
+
+    async def fetch(
+        self,
+        url: str,
+        render_hint: bool = False,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> FetchResult:
+        """Fetch ``url``, optionally through ``client`` (e.g. one bound to a proxy)."""
+
         await self._rate_limit(url)
         start = time.perf_counter()
         try:
-            async for attempt in AsyncRetrying(
-                reraise=True,
-                stop=stop_after_attempt(3),
-                wait=wait_exponential(multiplier=1, min=1, max=4),
-                retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-            ):
-                with attempt:
-                    response = await self.client.get(
-                        url,
-                        timeout=self.timeout,
-                        proxies=proxy if proxy else None,
-                    )
-                    elapsed_ms = int((time.perf_counter() - start) * 1000)
-                    body = response.text
-                    if looks_like_captcha(body):
-                        return FetchResult(
-                            url=url,
-                            final_url=str(response.url),
-                            status_code=response.status_code,
-                            body=body,
-                            elapsed_ms=elapsed_ms,
-                            error="captcha_detected",
-                        )
-                    need_render = self.render and (render_hint or is_js_heavy(body))
-                    snapshot_path = None
-                    if need_render:
-                        rendered = await self.render_page(str(response.url))
-                        if rendered:
-                            body, snapshot_path = rendered
-                    return FetchResult(
-                        url=url,
-                        final_url=str(response.url),
-                        status_code=response.status_code,
-                        body=body,
-                        elapsed_ms=elapsed_ms,
-                        snapshot_path=snapshot_path,
-                    )
-        except RetryError as exc:
-            last_attempt = exc.last_attempt
-            error_message = str(last_attempt.exception()) if last_attempt else str(exc)
-            return FetchResult(url=url, final_url=url, status_code=None, body=None, elapsed_ms=None, error=error_message)
+            response = await self._get(url, client or self.client)
+            elapsed_ms = int((time.perf_counter() - start) * 1000)
+            body = response.text
+            if looks_like_captcha(body):
+                return FetchResult(
+                    url=url,
+                    final_url=str(response.url),
+                    status_code=response.status_code,
+                    body=body,
+                    elapsed_ms=elapsed_ms,
+                    error="captcha_detected",
+                )
+            need_render = self.render and (render_hint or is_js_heavy(body))
+            snapshot_path = None
+            if need_render:
+                rendered = await self.render_page(str(response.url))
+                if rendered:
+                    body, snapshot_path = rendered
+            return FetchResult(
+                url=url,
+                final_url=str(response.url),
+                status_code=response.status_code,
+                body=body,
+                elapsed_ms=elapsed_ms,
+                snapshot_path=snapshot_path,
+            )
         except Exception as exc:
             return FetchResult(url=url, final_url=url, status_code=None, body=None, elapsed_ms=None, error=str(exc))
 
+    async def _ensure_browser(self):  # pragma: no cover - heavy
+        async with self._browser_lock:
+            if self._browser is None:
+                playwright = await async_playwright().start()
+                try:
+                    browser = await playwright.chromium.launch(headless=not self.headful)
+                except BaseException:
+                    # Don't leave the driver running without a browser; the next render retries from scratch.
+                    await playwright.stop()
+                    raise
+                self._playwright, self._browser = playwright, browser
+        return self._browser
+
+    async def close(self) -> None:
+        if self._browser is not None:  # pragma: no cover - heavy
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:  # pragma: no cover - heavy
+            await self._playwright.stop()
+            self._playwright = None
+
     async def render_page(self, url: str) -> Optional[tuple[str, Optional[str]]]:
         if async_playwright is None:
             logger.debug("Playwright not installed; skipping render")
             return None
         try:
-            async with async_playwright() as p:  # pragma: no cover - heavy
-                browser = await p.chromium.launch(headless=not self.headful)
-                page = await browser.new_page(user_agent=self.user_agent)
+            browser = await self._ensure_browser()  # pragma: no cover - heavy
+            page = await browser.new_page(user_agent=self.user_agent)
+            try:
                 await page.goto(url, wait_until="networkidle", timeout=self.timeout * 1000)
                 content = await page.content()
                 snapshot_path = None
@@ -131,10 +163,14 @@ class Fetcher:
                     Path = __import__("pathlib").Path  # lazy import
                     Path(self.snapshot_dir).mkdir(parents=True, exist_ok=True)
                     safe_name = urlparse(url).netloc.replace(":", "_")
-                    snapshot_path = str(Path(self.snapshot_dir) / f"{safe_name}.png")
-                    await page.screenshot(path=snapshot_path, full_page=True)
-                await browser.close()
+                    snapshot_path = str(Path(self.snapshot_dir) / f"{safe_name}.jpg")
+                    # Full-page PNGs run to megabytes; JPEG keeps them readable at a fraction of the size.
+                    await page.screenshot(
+                        path=snapshot_path, full_page=True, type="jpeg", quality=SNAPSHOT_JPEG_QUALITY
+                    )
                 return content, snapshot_path
+            finally:
+                await page.close()
         except Exception as exc:  # pragma: no cover - heavy
             logger.debug("Playwright rendering failed for %s: %s", url, exc)
             return None
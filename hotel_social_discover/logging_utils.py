@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Optional
 
+_listener: Optional[QueueListener] = None
+
 
 def configure_logging(log_file: Optional[Path] = None, level: int = logging.INFO) -> None:
-    """Configure console and optional file logging."""
+    """Configure console and optional file logging.
+
+    Records are handed to a background listener thread through a queue so that
+    coroutines never block on console or disk writes.
+    """
 
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
@@ -20,23 +27,39 @@ def configure_logging(log_file: Optional[Path] = None, level: int = logging.INFO
     root_logger.setLevel(level)
 
     # Avoid duplicate handlers
+    shutdown_logging()
     if root_logger.handlers:
         for handler in list(root_logger.handlers):
             root_logger.removeHandler(handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = RotatingFileHandler(log_file, maxBytes=5_000_000, backupCount=3)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    global _listener
+    log_queue: SimpleQueue = SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener, if running."""
+
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-__all__ = ["configure_logging", "get_logger"]
+__all__ = ["configure_logging", "get_logger", "shutdown_logging"]
@@ -5,13 +5,14 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
 
 try:
-    from bs4 import BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser
 except Exception:  # pragma: no cover - fallback when dependency missing
-    BeautifulSoup = None  # type: ignore
+    LexborHTMLParser = None  # type: ignore
     from html.parser import HTMLParser
 
     class _AnchorCollector(HTMLParser):
@@ -31,31 +32,41 @@ except Exception:  # pragma: no cover - fallback when dependency missing
         parser.feed(html)
         return parser.anchors
 else:
-    def _fallback_parse_anchors(html: str) -> List[str]:  # pragma: no cover - bs4 path
-        soup = BeautifulSoup(html, "lxml")
-        return [a.get("href") or "" for a in soup.find_all("a", href=True)]
+    def _fallback_parse_anchors(html: str) -> List[str]:  # pragma: no cover - selectolax path
+        tree = LexborHTMLParser(html)
+        return [node.attributes.get("href") or "" for node in tree.css("a[href]")]
 
 try:
     import tldextract
 except Exception:  # pragma: no cover - fallback when dependency missing
     tldextract = None  # type: ignore
 
+    @lru_cache(maxsize=8192)
     def _extract_domain(netloc: str) -> str:
         return netloc.lower()
 else:
+    @lru_cache(maxsize=8192)
     def _extract_domain(netloc: str) -> str:  # pragma: no cover - full dependency path
         ext = tldextract.extract(netloc)
         netloc_parts = [part for part in [ext.subdomain, ext.registered_domain] if part]
         return ".".join(netloc_parts).lower() if netloc_parts else netloc.lower()
 
-SOCIAL_PATTERNS = {
-    "facebook": re.compile(r"facebook\.com", re.I),
-    "instagram": re.compile(r"instagram\.com", re.I),
-    "x": re.compile(r"(?:twitter|x)\.com", re.I),
-    "youtube": re.compile(r"(?:youtube\.com|youtu\.be)", re.I),
-    "tiktok": re.compile(r"tiktok\.com", re.I),
-    "linkedin": re.compile(r"linkedin\.com", re.I),
-}
+SOCIAL_PLATFORMS = ("facebook", "instagram", "x", "youtube", "tiktok", "linkedin")
+
+# One named-group alternation so a single scan identifies the platform via ``lastgroup``.
+_SOCIAL_RE = re.compile(
+    r"(?P<facebook>facebook\.com)"
+    r"|(?P<instagram>instagram\.com)"
+    r"|(?P<x>(?:twitter|x)\.com)"
+    r"|(?P<youtube>youtube\.com|youtu\.be)"
+    r"|(?P<tiktok>tiktok\.com)"
+    r"|(?P<linkedin>linkedin\.com)",
+    re.I,
+)
+
+_ANCHOR_TAG_RE = re.compile(r"<a", re.I)
+_SCRIPT_TAG_RE = re.compile(r"<script", re.I)
+_CAPTCHA_RE = re.compile(r"captcha", re.I)
 
 TRACKING_PARAMS = {
     "utm_source",
@@ -92,9 +103,10 @@ def normalize_url(url: str, base_url: Optional[str] = None) -> Optional[str]:
 
     parsed = parsed._replace(netloc=_extract_domain(parsed.netloc))
 
-    query = parse_qs(parsed.query, keep_blank_values=False)
-    cleaned_query = {k: v for k, v in query.items() if k.lower() not in TRACKING_PARAMS}
-    parsed = parsed._replace(query=urlencode(cleaned_query, doseq=True))
+    if parsed.query:
+        query = parse_qs(parsed.query, keep_blank_values=False)
+        cleaned_query = {k: v for k, v in query.items() if k.lower() not in TRACKING_PARAMS}
+        parsed = parsed._replace(query=urlencode(cleaned_query, doseq=True))
 
     # remove fragments
     parsed = parsed._replace(fragment="")
@@ -103,28 +115,27 @@ def normalize_url(url: str, base_url: Optional[str] = None) -> Optional[str]:
     return normalized
 
 
+@lru_cache(maxsize=8192)
 def detect_platform(url: str) -> Optional[str]:
-    for platform, pattern in SOCIAL_PATTERNS.items():
-        if pattern.search(url):
-            return platform
-    return None
+    match = _SOCIAL_RE.search(url)
+    return match.lastgroup if match else None
 
 
 def resolve_duplicates(links: Iterable[SocialLink]) -> Tuple[Dict[str, List[str]], List[str]]:
-    bucket: Dict[str, List[str]] = {platform: [] for platform in SOCIAL_PATTERNS}
-    others: List[str] = []
+    # Dict keys keep first-seen order and give O(1) duplicate checks.
+    bucket: Dict[str, Dict[str, None]] = {platform: {} for platform in SOCIAL_PLATFORMS}
+    others: Dict[str, None] = {}
     for link in links:
         if link.platform and link.platform in bucket:
-            if link.url not in bucket[link.platform]:
-                bucket[link.platform].append(link.url)
+            bucket[link.platform][link.url] = None
         else:
-            if link.url not in others:
-                others.append(link.url)
-    return bucket, others
+            others[link.url] = None
+    return {platform: list(urls) for platform, urls in bucket.items()}, list(others)
 
 
 def parse_social_links(html: str, base_url: str) -> Tuple[Dict[str, List[str]], List[str]]:
-    anchors = _fallback_parse_anchors(html)
+    # Nav/footer links repeat; normalize each distinct href once, keeping first-seen order.
+    anchors = dict.fromkeys(_fallback_parse_anchors(html))
     links: List[SocialLink] = []
     for raw_href in anchors:
         href = normalize_url(raw_href, base_url)
@@ -137,21 +148,21 @@ def parse_social_links(html: str, base_url: str) -> Tuple[Dict[str, List[str]],
 
 
 def is_js_heavy(html: str) -> bool:
-    if not html:
-        return True
-    scripts = html.lower().count("<script")
-    anchors = html.lower().count("<a")
     if len(html) < 2_000:
         return True
-    if scripts > 20 and anchors < 5:
-        return True
-    return False
+    # Pages with a handful of anchors are never JS-heavy; stop counting once we know.
+    anchors = 0
+    for _ in _ANCHOR_TAG_RE.finditer(html):
+        anchors += 1
+        if anchors >= 5:
+            return False
+    return len(_SCRIPT_TAG_RE.findall(html)) > 20
 
 
 def looks_like_captcha(html: str) -> bool:
     if not html:
         return False
-    return bool(re.search(r"captcha", html, re.I))
+    return _CAPTCHA_RE.search(html) is not None
 
 
 __all__ = [
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Dict, Optional
 from urllib.parse import urljoin, urlparse
 
 import httpx
 
+from .checkpoint import CheckpointStore
+
 try:  # pragma: no cover - optional dependency
     from robotexclusionrulesparser import RobotExclusionRulesParser as RobotsParser
 except Exception:  # pragma: no cover
@@ -34,42 +37,43 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+ROBOTS_CACHE_TTL_SECONDS = 24 * 60 * 60
+ROBOTS_MISSING_STATUSES = frozenset({404, 410})
+
 
 @dataclass
 class RobotsCacheEntry:
     parser: RobotsParser
-    fetched: bool
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 class RobotsManager:
     """Manage robots.txt fetching and caching."""
 
-    def __init__(self, user_agent: str, client: httpx.AsyncClient) -> None:
+    def __init__(
+        self,
+        user_agent: str,
+        client: httpx.AsyncClient,
+        store: Optional[CheckpointStore] = None,
+        ttl_seconds: float = ROBOTS_CACHE_TTL_SECONDS,
+    ) -> None:
         self.user_agent = user_agent
         self.client = client
-        self._lock = asyncio.Lock()
+        self.store = store
+        self.ttl_seconds = ttl_seconds
         self._cache: Dict[str, RobotsCacheEntry] = {}
 
     async def allowed(self, url: str) -> bool:
         parsed = urlparse(url)
         base = f"{parsed.scheme}://{parsed.netloc}"
-        async with self._lock:
-            entry = self._cache.get(base)
-            if entry is None:
-                entry = RobotsCacheEntry(parser=RobotsParser(), fetched=False)
-                self._cache[base] = entry
-
-        if not entry.fetched:
-            robots_url = urljoin(base, "/robots.txt")
-            try:
-                response = await self.client.get(robots_url, timeout=10.0)
-                response.raise_for_status()
-                entry.parser.parse(response.text)
-                logger.debug("Fetched robots.txt from %s", robots_url)
-            except Exception as exc:  # pragma: no cover - network dependent
-                logger.debug("Failed to fetch robots.txt from %s: %s", robots_url, exc)
-            finally:
-                entry.fetched = True
+        entry = self._cache.get(base)
+        if entry is None:
+            # First caller for a host fetches robots.txt; later callers wait on ``ready``.
+            entry = self._cache[base] = RobotsCacheEntry(parser=RobotsParser())
+            if not self._load_stored(base, entry):
+                await self._fetch(base, entry)
+        elif not entry.ready.is_set():
+            await entry.ready.wait()
 
         try:
             allowed = entry.parser.can_fetch(self.user_agent, url)
@@ -77,5 +81,42 @@ class RobotsManager:
             allowed = True
         return allowed if allowed is not None else True
 
+    def _load_stored(self, base: str, entry: RobotsCacheEntry) -> bool:
+        """Populate ``entry`` from the persisted cache if a fresh copy exists."""
+
+        stored = self.store.get(base) if self.store else None
+        if not stored or time.time() - stored.get("fetched_at", 0) >= self.ttl_seconds:
+            return False
+        try:
+            entry.parser.parse(stored["text"])
+        except Exception:
+            return False
+        entry.ready.set()
+        return True
+
+    async def _fetch(self, base: str, entry: RobotsCacheEntry) -> None:
+        robots_url = urljoin(base, "/robots.txt")
+        text = ""
+        persist = False
+        try:
+            response = await self.client.get(robots_url, timeout=10.0)
+            if response.status_code in ROBOTS_MISSING_STATUSES:
+                # A definite absence is stored as empty (allow all) so later runs skip the request.
+                persist = True
+            else:
+                response.raise_for_status()
+                text = response.text
+                persist = True
+                logger.debug("Fetched robots.txt from %s", robots_url)
+        except Exception as exc:  # pragma: no cover - network dependent
+            # Transient failures only apply to this run; the next one asks again.
+            logger.debug("Failed to fetch robots.txt from %s: %s", robots_url, exc)
+        try:
+            entry.parser.parse(text)
+            if persist and self.store is not None:
+                self.store.set(base, {"text": text, "fetched_at": time.time()})
+        finally:
+            entry.ready.set()
+
 
 __all__ = ["RobotsManager"]
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import csv
-import json
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import orjson
+
+from .parser import SOCIAL_PLATFORMS
+
+try:  # pragma: no cover - optional fast path
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except Exception:  # pragma: no cover - fallback when dependency missing
+    pa = None  # type: ignore
+    pacsv = None  # type: ignore
 
 
 OUTPUT_COLUMNS = [
@@ -34,6 +45,11 @@ OUTPUT_COLUMNS = [
     "last_checked_utc_iso",
     "error_message",
 ]
+_OUTPUT_KEYS = tuple(OUTPUT_COLUMNS)
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 @dataclass
@@ -58,59 +74,142 @@ class ResultRow:
     linkedin_url: Optional[str] = None
     other_socials: List[str] = field(default_factory=list)
     page_snapshot_path: Optional[str] = None
-    last_checked_utc_iso: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    # None means "stamp when written"; callers building many rows pass one shared timestamp.
+    last_checked_utc_iso: Optional[str] = None
     error_message: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Optional[str]]:
-        return {
-            "hotel_id": self.hotel_id,
-            "hotel_name": self.hotel_name,
-            "url": self.url,
-            "canonical_url": self.canonical_url or "",
-            "http_status": self.http_status if self.http_status is not None else "",
-            "response_time_ms": self.response_time_ms if self.response_time_ms is not None else "",
-            "found:facebook": str(self.found_facebook).lower(),
-            "facebook_url": self.facebook_url or "",
-            "found:instagram": str(self.found_instagram).lower(),
-            "instagram_url": self.instagram_url or "",
-            "found:x": str(self.found_x).lower(),
-            "x_url": self.x_url or "",
-            "found:youtube": str(self.found_youtube).lower(),
-            "youtube_url": self.youtube_url or "",
-            "found:tiktok": str(self.found_tiktok).lower(),
-            "tiktok_url": self.tiktok_url or "",
-            "found:linkedin": str(self.found_linkedin).lower(),
-            "linkedin_url": self.linkedin_url or "",
-            "other_socials": "|".join(self.other_socials),
-            "page_snapshot_path": self.page_snapshot_path or "",
-            "last_checked_utc_iso": self.last_checked_utc_iso,
-            "error_message": self.error_message or "",
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **overrides: Any) -> "ResultRow":
+        """Rebuild a row from its :meth:`to_dict` form, e.g. a checkpoint entry."""
+
+        values: Dict[str, Any] = {
+            "hotel_id": data.get("hotel_id", ""),
+            "hotel_name": data.get("hotel_name", ""),
+            "url": data.get("url", ""),
+            "canonical_url": data.get("canonical_url") or None,
+            "http_status": data.get("http_status") if data.get("http_status") != "" else None,
+            "response_time_ms": data.get("response_time_ms") if data.get("response_time_ms") != "" else None,
+            "other_socials": [link for link in (data.get("other_socials") or "").split("|") if link],
+            "page_snapshot_path": data.get("page_snapshot_path") or None,
+            "error_message": data.get("error_message") or None,
         }
+        for platform in SOCIAL_PLATFORMS:
+            values[f"found_{platform}"] = data.get(f"found:{platform}") == "true"
+            values[f"{platform}_url"] = data.get(f"{platform}_url") or None
+        if data.get("last_checked_utc_iso"):
+            values["last_checked_utc_iso"] = data["last_checked_utc_iso"]
+        values.update(overrides)
+        return cls(**values)
+
+    def to_row(self, timestamp: Optional[str] = None) -> tuple:
+        """Return the CSV cells in ``OUTPUT_COLUMNS`` order.
+
+        Rows without ``last_checked_utc_iso`` use ``timestamp``; with neither, the row is stamped now.
+        """
+
+        if self.last_checked_utc_iso is None and timestamp is None:
+            self.last_checked_utc_iso = utc_now_iso()
+
+        return (
+            self.hotel_id,
+            self.hotel_name,
+            self.url,
+            self.canonical_url or "",
+            self.http_status if self.http_status is not None else "",
+            self.response_time_ms if self.response_time_ms is not None else "",
+            "true" if self.found_facebook else "false",
+            self.facebook_url or "",
+            "true" if self.found_instagram else "false",
+            self.instagram_url or "",
+            "true" if self.found_x else "false",
+            self.x_url or "",
+            "true" if self.found_youtube else "false",
+            self.youtube_url or "",
+            "true" if self.found_tiktok else "false",
+            self.tiktok_url or "",
+            "true" if self.found_linkedin else "false",
+            self.linkedin_url or "",
+            "|".join(self.other_socials),
+            self.page_snapshot_path or "",
+            self.last_checked_utc_iso or timestamp,
+            self.error_message or "",
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_OUTPUT_KEYS, self.to_row()))
+
+
+def read_input_table(path: Path) -> "pa.Table":
+    """Read the input CSV into a PyArrow table with every column typed as a string."""
+
+    if pacsv is None:
+        raise RuntimeError("pyarrow is required for read_input_table")
+    # utf-8-sig: a BOM would otherwise glue onto the first name and leave that column type-inferred.
+    with path.open("r", newline="", encoding="utf-8-sig") as handle:
+        header = next(csv.reader(handle), [])
+    if not header:
+        return pa.table({})
+    return pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+        convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header}),
+    )
 
 
 def read_input_csv(path: Path) -> List[Dict[str, str]]:
-    with path.open("r", newline="", encoding="utf-8") as handle:
+    if pacsv is not None:
+        try:
+            return read_input_table(path).to_pylist()
+        except pa.ArrowInvalid:
+            # Rows with the wrong field count; the csv module tolerates them like the pre-pyarrow reader did.
+            pass
+    with path.open("r", newline="", encoding="utf-8-sig") as handle:
         reader = csv.DictReader(handle)
         return [dict(row) for row in reader]
 
 
-def write_output_csv(path: Path, rows: Iterable[ResultRow]) -> None:
+# Large write buffer so streamed rows reach the OS in few syscalls.
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def open_output_csv(path: Path) -> Iterator[Any]:
+    """Open the output CSV, write the header and yield a ``csv.writer`` for streaming rows."""
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=OUTPUT_COLUMNS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row.to_dict())
+    with path.open("w", newline="", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(OUTPUT_COLUMNS)
+        yield writer
+
+
+def write_output_row(writer: Any, row: ResultRow, timestamp: Optional[str] = None) -> None:
+    writer.writerow(row.to_row(timestamp))
+
+
+def write_output_csv(path: Path, rows: Iterable[ResultRow], timestamp: Optional[str] = None) -> None:
+    """Write ``rows`` to ``path``.
+
+    ``rows`` is consumed lazily, so a generator keeps memory flat regardless of row count.
+    """
+
+    timestamp = timestamp or utc_now_iso()
+    with open_output_csv(path) as writer:
+        writer.writerows(row.to_row(timestamp) for row in rows)
 
 
 def write_summary_json(path: Path, summary: Dict[str, int]) -> None:
-    path.write_text(json.dumps(summary, indent=2, sort_keys=True))
+    path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
 
 
 __all__ = [
     "ResultRow",
     "read_input_csv",
+    "read_input_table",
+    "open_output_csv",
+    "write_output_row",
     "write_output_csv",
     "write_summary_json",
+    "utc_now_iso",
     "OUTPUT_COLUMNS",
 ]
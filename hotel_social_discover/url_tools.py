@@ -2,30 +2,33 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
 import httpx
 
+try:  # pragma: no cover - optional dependency installed by the httpx[http2] extra
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - fall back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+# Servers that refuse HEAD answer with one of these; retry those with GET.
+_HEAD_UNSUPPORTED = {405, 501}
+
+
+async def resolve_redirects(client: httpx.AsyncClient, url: str) -> str:
+    """Return the final URL after following redirects from ``url``.
+
+    The chain is followed by httpx in a single call, bounded by the client's
+    ``max_redirects``. Any failure resolves to the original URL.
+    """
+
+    try:
+        response = await client.head(url, follow_redirects=True, timeout=10.0)
+        if response.status_code in _HEAD_UNSUPPORTED:
+            response = await client.get(url, follow_redirects=True, timeout=10.0)
+    except Exception:
+        return url
+    return str(response.url)
+
 
-async def resolve_redirects(client: httpx.AsyncClient, url: str, max_hops: int = 5) -> str:
-    current = url
-    for _ in range(max_hops):
-        try:
-            response = await client.head(current, follow_redirects=False, timeout=10.0)
-        except Exception:
-            return current
-        if response.status_code in {301, 302, 303, 307, 308} and "location" in response.headers:
-            current = response.headers["location"]
-            if not current.startswith("http"):
-                # Fallback to GET with follow redirects to resolve relative
-                try:
-                    final = await client.get(url, follow_redirects=True, timeout=10.0)
-                    return str(final.url)
-                except Exception:
-                    return url
-        else:
-            return current
-    return current
-
-
-__all__ = ["resolve_redirects"]
+__all__ = ["HTTP2_AVAILABLE", "resolve_redirects"]
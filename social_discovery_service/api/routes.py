@@ -57,6 +57,20 @@ async def get_job_status(
     return JobStatusResponse(**job.to_dict())
 
 
+class JobStatusBatchRequest(BaseModel):
+    job_ids: List[str] = Field(..., min_items=1, max_items=500, description="Job ids to look up")
+
+
+@router.post("/jobs/status:batch", response_model=Dict[str, JobStatusResponse])
+async def get_job_status_batch(
+    payload: JobStatusBatchRequest,
+    manager: JobManager = Depends(get_job_manager),
+    _: Role = Depends(require_roles(Role.ADMIN, Role.SUBMITTER)),
+) -> Dict[str, JobStatusResponse]:
+    jobs = await manager.get_jobs_bulk(payload.job_ids)
+    return {job.job_id: JobStatusResponse(**job.to_dict()) for job in jobs}
+
+
 class DiscoveredLink(BaseModel):
     url: str
     source_url: Optional[str]
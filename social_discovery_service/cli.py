@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -11,7 +10,7 @@ import typer
 
 from .config import Settings, get_settings
 from .jobs.manager import JobManager, get_job_manager
-from .worker.runner import run_worker
+from .worker.runner import run_async, run_worker
 
 app = typer.Typer(help="Social Discovery Service command line interface")
 
@@ -42,14 +41,17 @@ def enqueue(
     """Enqueue a batch of jobs from a newline separated file."""
 
     manager = get_job_manager()
-    domains = [line.strip() for line in domains_file.read_text().splitlines() if line.strip()]
+    # Dedupe before enqueueing so repeated lines do not become duplicate jobs; keeps file order. Keys are
+    # normalized the way enqueue_batch stores domains, so "Example.com" and "example.com" are one job.
+    normalized = (line.strip().lower() for line in domains_file.read_text().splitlines())
+    domains = [domain for domain in dict.fromkeys(normalized) if domain]
     payload_metadata = {}
     if metadata:
         import json
 
         payload_metadata = json.loads(metadata)
 
-    batch = asyncio.run(manager.enqueue_batch(batch_name, domains, payload_metadata))
+    batch = run_async(manager.enqueue_batch(batch_name, domains, payload_metadata))
     typer.echo(f"Submitted batch {batch.batch_id} with {len(batch.jobs)} jobs")
 
 
@@ -64,7 +66,7 @@ def worker(
     logging.basicConfig(level=log_level)
     settings = get_settings()
     manager = get_job_manager()
-    asyncio.run(run_worker(manager, queue=queue, once=once, settings=settings))
+    run_async(run_worker(manager, queue=queue, once=once, settings=settings))
 
 
 @app.command()
@@ -23,6 +23,10 @@ class Settings(BaseSettings):
         description="SQLAlchemy compatible DSN",
     )
     alembic_ini_path: Path = Field(Path("./alembic.ini"), description="Path to alembic.ini for migrations")
+    db_pool_size: int = Field(20, ge=1, description="Persistent connections kept in the SQLAlchemy pool")
+    db_max_overflow: int = Field(40, ge=0, description="Extra connections allowed beyond the pool size under load")
+    db_pool_recycle_seconds: int = Field(1800, ge=1, description="Recycle pooled connections older than this")
+    db_statement_cache_size: int = Field(1024, ge=0, description="asyncpg prepared statement cache size per connection")
 
     # Redis / broker for distributed queues
     redis_url: str = Field("redis://localhost:6379/0", description="Redis connection URI")
@@ -34,6 +38,7 @@ class Settings(BaseSettings):
     proxy_rotation_seconds: int = Field(300, ge=1, description="How frequently proxies should be rotated")
     proxy_failure_threshold: int = Field(5, ge=1, description="Failures before a proxy is quarantined")
     proxy_quarantine_seconds: int = Field(900, ge=60, description="Quarantine duration for unhealthy proxies")
+    persist_proxy_state: bool = Field(True, description="Share proxy failure and quarantine state through Redis")
 
     # Rate limiting & politeness
     per_domain_concurrency: int = Field(2, ge=1, description="Max concurrent tasks per domain")
@@ -43,6 +48,26 @@ class Settings(BaseSettings):
     # Retry configuration
     max_retries: int = Field(3, ge=0, description="Maximum retries for a fetch job")
     request_timeout_seconds: int = Field(20, ge=1, description="HTTP request timeout")
+    max_response_bytes: int = Field(5_000_000, ge=1024, description="Bytes of a page body kept for parsing")
+    http_max_connections: int = Field(200, ge=1, description="Connection pool size of the worker HTTP client")
+    http_max_keepalive_connections: int = Field(100, ge=0, description="Idle connections kept alive for reuse")
+    http_keepalive_expiry_seconds: float = Field(60.0, gt=0.0, description="How long idle connections stay pooled")
+    user_agent: str = Field("social-discovery-service/0.1", description="User-Agent sent with outbound requests")
+
+    # Fetch attempt logging
+    attempt_flush_interval_seconds: float = Field(
+        0.5, gt=0.0, description="Max time buffered fetch attempts wait before being written"
+    )
+    attempt_flush_batch_size: int = Field(100, ge=1, description="Buffered fetch attempts that trigger an early write")
+
+    # Worker pipeline
+    worker_concurrency: int = Field(8, ge=1, description="Jobs a worker processes concurrently")
+
+    # Worker parsing
+    parser_threads: int = Field(4, ge=1, description="Threads available for HTML parsing off the event loop")
+
+    # Worker checkpoints
+    checkpoint_flush_seconds: float = Field(5.0, gt=0.0, description="Interval between checkpoint flushes to disk")
 
     # Security
     admin_api_keys: List[str] = Field(default_factory=list, description="Admin level API keys")
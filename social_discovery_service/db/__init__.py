@@ -1,7 +1,7 @@
 """Database package."""
 
 from .models import Base, CrawlJob, DiscoveredLink, FetchAttempt, Hotel
-from .session import get_engine, get_sessionmaker, session_scope
+from .session import get_engine, get_read_sessionmaker, get_sessionmaker, read_session_scope, session_scope
 
 __all__ = [
     "Base",
@@ -10,6 +10,8 @@ __all__ = [
     "FetchAttempt",
     "Hotel",
     "get_engine",
+    "get_read_sessionmaker",
     "get_sessionmaker",
+    "read_session_scope",
     "session_scope",
 ]
@@ -0,0 +1,27 @@
+"""Partial index for polling queued crawl jobs."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202610150000"
+down_revision = "202401010000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_crawl_jobs_queued",
+        "crawl_jobs",
+        ["created_at"],
+        postgresql_where=sa.text("status IN ('queued', 'retry')"),
+    )
+    op.drop_index("ix_crawl_jobs_status", table_name="crawl_jobs")
+
+
+def downgrade() -> None:
+    op.create_index("ix_crawl_jobs_status", "crawl_jobs", ["status"])
+    op.drop_index("ix_crawl_jobs_queued", table_name="crawl_jobs")
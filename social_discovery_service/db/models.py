@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -20,8 +20,8 @@ class Hotel(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     domain: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     name: Mapped[Optional[str]] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     jobs: Mapped[list["CrawlJob"]] = relationship(back_populates="hotel")
 
@@ -32,17 +32,23 @@ class CrawlJob(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     job_id: Mapped[str] = mapped_column(String(36), unique=True, nullable=False, index=True)
     hotel_id: Mapped[int] = mapped_column(ForeignKey("hotels.id", ondelete="CASCADE"), nullable=False)
-    status: Mapped[str] = mapped_column(String(32), default="queued", index=True)
+    status: Mapped[str] = mapped_column(String(32), default="queued")
     attempts: Mapped[int] = mapped_column(Integer, default=0)
     last_error: Mapped[Optional[str]] = mapped_column(Text)
-    metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    # "metadata" is reserved on declarative classes; keep the column name, rename the attribute.
+    job_metadata: Mapped[dict] = mapped_column("metadata", JSONB, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     hotel: Mapped[Hotel] = relationship(back_populates="jobs")
     links: Mapped[list["DiscoveredLink"]] = relationship(back_populates="job")
     attempts_rel: Mapped[list["FetchAttempt"]] = relationship(back_populates="job")
 
+    __table_args__ = (
+        # Workers only ever poll pending jobs, so index just those rows in FIFO order.
+        Index("ix_crawl_jobs_queued", "created_at", postgresql_where=text("status IN ('queued', 'retry')")),
+    )
+
 
 class DiscoveredLink(Base):
     __tablename__ = "discovered_links"
@@ -52,7 +58,7 @@ class DiscoveredLink(Base):
     url: Mapped[str] = mapped_column(Text, nullable=False)
     network: Mapped[Optional[str]] = mapped_column(String(32))
     source_url: Mapped[Optional[str]] = mapped_column(Text)
-    last_seen: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    last_seen: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     job: Mapped[CrawlJob] = relationship(back_populates="links")
@@ -73,7 +79,7 @@ class FetchAttempt(Base):
     success: Mapped[bool] = mapped_column(Boolean, default=False)
     error: Mapped[Optional[str]] = mapped_column(Text)
     response_time_ms: Mapped[Optional[int]] = mapped_column(Integer)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
 
     job: Mapped[CrawlJob] = relationship(back_populates="attempts_rel")
 
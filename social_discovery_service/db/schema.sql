@@ -18,7 +18,7 @@ CREATE TABLE IF NOT EXISTS crawl_jobs (
     created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT NOW() NOT NULL,
     completed_at TIMESTAMP WITHOUT TIME ZONE
 );
-CREATE INDEX IF NOT EXISTS idx_crawl_jobs_status ON crawl_jobs(status);
+CREATE INDEX IF NOT EXISTS ix_crawl_jobs_queued ON crawl_jobs(created_at) WHERE status IN ('queued', 'retry');
 
 CREATE TABLE IF NOT EXISTS fetch_attempts (
     id SERIAL PRIMARY KEY,
@@ -3,20 +3,42 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from ..config import get_settings
 
 _engine = None
 _sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_read_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
 
 
 def get_engine():
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_async_engine(settings.database_url, echo=False, future=True)
+        _engine = create_async_engine(
+            settings.database_url,
+            echo=False,
+            future=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            # JSONB columns (job metadata) are encoded by the asyncpg codec through these hooks.
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            connect_args={
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+            },
+        )
     return _engine
 
 
@@ -27,17 +49,36 @@ def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
     return _sessionmaker
 
 
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Sessions for read-only queries: autocommit, so no BEGIN/COMMIT round trips."""
+
+    global _read_sessionmaker
+    if _read_sessionmaker is None:
+        # execution_options() returns a view of the same engine, so reads share the main pool.
+        read_engine = get_engine().execution_options(isolation_level="AUTOCOMMIT")
+        _read_sessionmaker = async_sessionmaker(bind=read_engine, expire_on_commit=False)
+    return _read_sessionmaker
+
+
 @asynccontextmanager
-def session_scope():
-    session = get_sessionmaker()()
-    try:
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Yield a session that commits on success and rolls back on error."""
+
+    async with get_sessionmaker()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+@asynccontextmanager
+async def read_session_scope() -> AsyncIterator[AsyncSession]:
+    """Yield an autocommit session for queries that never write."""
+
+    async with get_read_sessionmaker()() as session:
         yield session
-        await session.commit()
-    except Exception:
-        await session.rollback()
-        raise
-    finally:
-        await session.close()
 
 
-__all__ = ["get_engine", "get_sessionmaker", "session_scope"]
+__all__ = ["get_engine", "get_read_sessionmaker", "get_sessionmaker", "read_session_scope", "session_scope"]
@@ -2,40 +2,49 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict
 
+import orjson
+
 from ..config import get_settings
 
 
 class CheckpointStore:
-    """Persist checkpoints to disk for worker recovery."""
+    """Persist checkpoints to disk for worker recovery.
+
+    Updates are kept in memory and written out by :meth:`flush`, which the worker
+    calls periodically and on shutdown instead of rewriting the file per job.
+    """
 
     def __init__(self) -> None:
         settings = get_settings()
         self.path = settings.data_dir / "checkpoints.json"
         if not self.path.exists():
             self.path.write_text("{}", encoding="utf-8")
+        self._state: Dict[str, str] = self.read()
+        self._dirty = False
 
     def read(self) -> Dict[str, str]:
-        return json.loads(self.path.read_text(encoding="utf-8"))
+        return orjson.loads(self.path.read_bytes())
 
     def write(self, data: Dict[str, str]) -> None:
         tmp = self.path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         tmp.replace(self.path)
 
     def update_job(self, worker_id: str, job_id: str) -> None:
-        data = self.read()
-        data[worker_id] = job_id
-        self.write(data)
+        self._state[worker_id] = job_id
+        self._dirty = True
 
     def clear_job(self, worker_id: str) -> None:
-        data = self.read()
-        if worker_id in data:
-            data.pop(worker_id)
-            self.write(data)
+        if self._state.pop(worker_id, None) is not None:
+            self._dirty = True
+
+    def flush(self) -> None:
+        if self._dirty:
+            self.write(self._state)
+            self._dirty = False
 
 
 __all__ = ["CheckpointStore"]
@@ -5,13 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from collections import defaultdict
-from datetime import datetime
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 import httpx
-from playwright.async_api import Browser
-from sqlalchemy import Select, select
+from playwright.async_api import Browser, BrowserContext
+from sqlalchemy import func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload
 
@@ -22,7 +21,7 @@ from ..db.models import CrawlJob as CrawlJobModel
 from ..db.models import DiscoveredLink as DiscoveredLinkModel
 from ..db.models import FetchAttempt as FetchAttemptModel
 from ..db.models import Hotel as HotelModel
-from ..db.session import session_scope
+from ..db.session import read_session_scope, session_scope
 from ..monitoring.metrics import (
     FETCH_ATTEMPTS_TOTAL,
     FETCH_LATENCY,
@@ -34,6 +33,37 @@ from .models import CrawlJob, JobBatch
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+MAX_TRACKED_DOMAINS = 100_000
+# Browser contexts kept open per worker, one per proxy; least recently used ones are closed.
+MAX_BROWSER_CONTEXTS = 8
+_NO_CONTEXT = object()
+RESPONSE_CHUNK_SIZE = 64 * 1024
+# Column limits for stored error text.
+ATTEMPT_ERROR_MAX_LEN = 5000
+JOB_ERROR_MAX_LEN = 1000
+# Rows per multi-row INSERT; keeps each statement well under Postgres' 32767 bind parameter limit.
+INSERT_CHUNK_SIZE = 5_000
+# Consecutive failed flushes after which buffered fetch attempts (audit rows only) are dropped.
+MAX_ATTEMPT_FLUSH_RETRIES = 5
+
+
+@dataclass
+class _DomainState:
+    """Per-domain politeness state: concurrency slots and the last reserved request time."""
+
+    # Slots are a counter guarded by a condition rather than a Semaphore so the limit can change at runtime.
+    limit: int
+    cond: asyncio.Condition = field(default_factory=asyncio.Condition)
+    active: int = 0
+    last_request: float = 0.0
+    # Jobs holding or waiting for a slot; a domain is only evicted once this drops to zero.
+    in_flight: int = 0
+
+    def is_idle(self) -> bool:
+        return self.in_flight == 0
+
 
 class JobManager:
     """Coordinates queueing, fetching, and persisting job results."""
@@ -41,32 +71,61 @@ class JobManager:
     def __init__(self, proxy_pool: Optional[ProxyPool] = None) -> None:
         self.settings = get_settings()
         self.proxy_pool = proxy_pool or get_proxy_pool()
-        self._domain_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
-        self._domain_last_request: Dict[str, float] = defaultdict(lambda: 0.0)
-        self._domain_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
-            lambda: asyncio.Semaphore(self.settings.per_domain_concurrency)
-        )
+        # Insertion ordered by last use, so the first idle entry is the least recently used domain.
+        self._domain_state: Dict[str, _DomainState] = {}
+        # Limits set through set_domain_limit; kept apart so evicting an idle domain doesn't reset them.
+        self._domain_limits: Dict[str, int] = {}
+        # Fetch attempts are audit rows; buffer them and write in bulk instead of one commit per fetch.
+        self._attempt_buffer: List[Dict] = []
+        # Failed-job status updates ride along with the attempt flush instead of a transaction each.
+        self._failed_job_buffer: List[Dict] = []
+        self._attempt_flusher: Optional[asyncio.Task] = None
+        # Set when the attempt buffer fills up so the flusher writes before its interval elapses.
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flush_failures = 0
+        self._closing = False
 
     async def enqueue_batch(self, batch_name: str, domains: List[str], metadata: Dict) -> JobBatch:
         batch = JobBatch.create(batch_name, domains, metadata)
+        if not batch.jobs:
+            return batch
+        # ON CONFLICT DO UPDATE may touch each row once per statement, so upsert unique domains.
+        unique_domains = list(dict.fromkeys(job.domain.lower().strip() for job in batch.jobs))
         async with session_scope() as session:
+            hotel_ids: Dict[str, int] = {}
+            for chunk in _chunks(unique_domains, INSERT_CHUNK_SIZE):
+                hotel_rows = await session.execute(
+                    insert(HotelModel)
+                    .values([{"domain": domain} for domain in chunk])
+                    .on_conflict_do_update(index_elements=[HotelModel.domain], set_={"updated_at": func.now()})
+                    .returning(HotelModel.id, HotelModel.domain)
+                )
+                hotel_ids.update((row.domain, row.id) for row in hotel_rows)
+
+            db_ids: Dict[str, int] = {}
+            for chunk in _chunks(batch.jobs, INSERT_CHUNK_SIZE):
+                job_rows = await session.execute(
+                    insert(CrawlJobModel)
+                    .values(
+                        [
+                            {
+                                "job_id": job.job_id,
+                                "hotel_id": hotel_ids[job.domain.lower().strip()],
+                                "job_metadata": job.metadata,
+                            }
+                            for job in chunk
+                        ]
+                    )
+                    .returning(CrawlJobModel.id, CrawlJobModel.job_id)
+                )
+                db_ids.update((row.job_id, row.id) for row in job_rows)
             for job in batch.jobs:
-                domain = job.domain.lower().strip()
-                hotel = await session.scalar(select(HotelModel).where(HotelModel.domain == domain))
-                if not hotel:
-                    hotel = HotelModel(domain=domain)
-                    session.add(hotel)
-                    await session.flush()
-
-                db_job = CrawlJobModel(job_id=job.job_id, hotel_id=hotel.id, metadata=job.metadata)
-                session.add(db_job)
-                await session.flush()
-                job.db_id = db_job.id
+                job.db_id = db_ids[job.job_id]
         logger.info("Enqueued batch", extra={"batch_name": batch_name, "job_count": len(batch.jobs)})
         return batch
 
     async def get_job(self, job_id: str) -> Optional[CrawlJob]:
-        async with session_scope() as session:
+        async with read_session_scope() as session:
             db_job = await session.scalar(
                 select(CrawlJobModel)
                 .options(joinedload(CrawlJobModel.hotel))
@@ -74,88 +133,133 @@ class JobManager:
             )
             if not db_job:
                 return None
-            job = CrawlJob(
-                job_id=db_job.job_id,
-                domain=db_job.hotel.domain,
-                status=db_job.status,
-                attempts=db_job.attempts,
-                last_error=db_job.last_error,
-                completed_at=db_job.completed_at,
-                metadata=db_job.metadata or {},
-                db_id=db_job.id,
+            return _job_from_model(db_job)
+
+    async def get_jobs_bulk(self, job_ids: List[str]) -> List[CrawlJob]:
+        """Fetch several jobs in one query; unknown ids are simply absent."""
+
+        async with read_session_scope() as session:
+            result = await session.scalars(
+                select(CrawlJobModel)
+                .options(joinedload(CrawlJobModel.hotel))
+                .where(CrawlJobModel.job_id.in_(job_ids))
             )
-            return job
+            return [_job_from_model(db_job) for db_job in result]
 
     async def get_discovered_links(self, job_id: str, limit: int) -> List[Dict]:
-        async with session_scope() as session:
+        async with read_session_scope() as session:
+            # Select just the returned columns so no ORM objects are built for a read-only listing.
             result = await session.execute(
-                select(DiscoveredLinkModel)
+                select(
+                    DiscoveredLinkModel.url,
+                    DiscoveredLinkModel.source_url,
+                    DiscoveredLinkModel.network,
+                    DiscoveredLinkModel.last_seen,
+                )
                 .join(CrawlJobModel)
                 .where(CrawlJobModel.job_id == job_id)
                 .order_by(DiscoveredLinkModel.last_seen.desc())
                 .limit(limit)
             )
-            return [
-                {
-                    "url": row.url,
-                    "source_url": row.source_url,
-                    "network": row.network,
-                    "last_seen": row.last_seen,
-                }
-                for row in result.scalars()
-            ]
+            return [row._asdict() for row in result]
 
     async def reserve_next_job(self, queue: str) -> Optional[CrawlJob]:
-        async with session_scope() as session:
-            stmt: Select[CrawlJobModel] = (
-                select(CrawlJobModel)
-                .options(joinedload(CrawlJobModel.hotel))
-                .where(CrawlJobModel.status.in_(["queued", "retry"]))
-                .order_by(CrawlJobModel.created_at)
-                .with_for_update(skip_locked=True)
-                .limit(1)
-            )
-            result = await session.execute(stmt)
-            db_job = result.scalar_one_or_none()
-            if not db_job:
-                return None
-
-            db_job.status = "in_progress"
-            db_job.attempts += 1
-            await session.flush()
-
-            job = CrawlJob(
-                job_id=db_job.job_id,
-                domain=db_job.hotel.domain,
-                status=db_job.status,
-                attempts=db_job.attempts,
-                metadata=db_job.metadata or {},
-                db_id=db_job.id,
+        # Claim the oldest pending job and read its hotel domain in one UPDATE ... RETURNING;
+        # the subquery walks ix_crawl_jobs_queued and skips rows other workers have locked.
+        pending_id = (
+            select(CrawlJobModel.id)
+            .where(CrawlJobModel.status.in_(["queued", "retry"]))
+            .order_by(CrawlJobModel.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(CrawlJobModel)
+            .where(CrawlJobModel.id == pending_id, CrawlJobModel.hotel_id == HotelModel.id)
+            .values(status="in_progress", attempts=CrawlJobModel.attempts + 1)
+            .returning(
+                CrawlJobModel.id,
+                CrawlJobModel.job_id,
+                CrawlJobModel.attempts,
+                CrawlJobModel.job_metadata,
+                HotelModel.domain,
             )
+            .execution_options(synchronize_session=False)
+        )
+        async with session_scope() as session:
+            row = (await session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+
+        db_id, job_id, attempts, job_metadata, domain = row
+        job = CrawlJob(
+            job_id=job_id,
+            domain=domain,
+            status="in_progress",
+            attempts=attempts,
+            metadata=job_metadata or {},
+            db_id=db_id,
+        )
 
         await self._acquire_domain_slot(job.domain)
         IN_PROGRESS_JOBS.inc()
         return job
 
+    def _get_domain_state(self, domain: str) -> _DomainState:
+        state = self._domain_state.pop(domain, None)
+        if state is None:
+            state = _DomainState(self._domain_limits.get(domain, self.settings.per_domain_concurrency))
+            if len(self._domain_state) >= MAX_TRACKED_DOMAINS:
+                self._evict_idle_domain()
+        self._domain_state[domain] = state
+        return state
+
+    def _evict_idle_domain(self) -> None:
+        for domain, state in self._domain_state.items():
+            if state.is_idle():
+                del self._domain_state[domain]
+                return
+
     async def _respect_domain_delay(self, domain: str) -> None:
-        lock = self._domain_locks[domain]
-        async with lock:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self._domain_last_request[domain]
-            delay = self.settings.per_domain_delay_seconds - elapsed
-            if delay > 0:
-                await asyncio.sleep(delay)
-            self._domain_last_request[domain] = asyncio.get_event_loop().time()
+        # Reserve the next send time and sleep without holding anything, so waiters for one
+        # domain queue up distinct future slots instead of sleeping one after another.
+        state = self._get_domain_state(domain)
+        now = asyncio.get_running_loop().time()
+        scheduled = max(now, state.last_request + self.settings.per_domain_delay_seconds)
+        state.last_request = scheduled
+        delay = scheduled - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     async def _acquire_domain_slot(self, domain: str) -> None:
-        semaphore = self._domain_semaphores[domain]
-        await semaphore.acquire()
+        state = self._get_domain_state(domain)
+        state.in_flight += 1
+        try:
+            async with state.cond:
+                await state.cond.wait_for(lambda: state.active < state.limit)
+                state.active += 1
+        except BaseException:
+            state.in_flight -= 1
+            raise
 
     async def _release_domain_slot(self, domain: str) -> None:
-        semaphore = self._domain_semaphores[domain]
-        semaphore.release()
-
-    async def _record_fetch_attempt(
+        state = self._get_domain_state(domain)
+        state.in_flight -= 1
+        async with state.cond:
+            state.active -= 1
+            state.cond.notify(1)
+
+    async def set_domain_limit(self, domain: str, limit: int) -> None:
+        """Change how many jobs may run against ``domain`` at once, waking waiters if it grew."""
+
+        self._domain_limits[domain] = limit
+        state = self._get_domain_state(domain)
+        async with state.cond:
+            state.limit = limit
+            state.cond.notify_all()
+
+    def _record_fetch_attempt(
         self,
         job: CrawlJob,
         proxy: Optional[str],
@@ -164,17 +268,82 @@ class JobManager:
         error: Optional[str],
         response_time_ms: Optional[int],
     ) -> None:
-        async with session_scope() as session:
-            attempt = FetchAttemptModel(
-                job_id=job.db_id,
-                proxy=proxy,
-                status_code=status_code,
-                success=success,
-                error=error[:5000] if error else None,
-                response_time_ms=response_time_ms,
-            )
-            session.add(attempt)
+        self._attempt_buffer.append(
+            {
+                "job_id": job.db_id,
+                "proxy": proxy,
+                "status_code": status_code,
+                "success": success,
+                "error": error[:ATTEMPT_ERROR_MAX_LEN] if error else None,
+                "response_time_ms": response_time_ms,
+            }
+        )
         FETCH_ATTEMPTS_TOTAL.inc()
+        self._ensure_flusher()
+        if len(self._attempt_buffer) >= self.settings.attempt_flush_batch_size:
+            # Never write inline: a DB error here would surface as a failure of the job being fetched.
+            self._flush_requested.set()
+
+    def _ensure_flusher(self) -> None:
+        if self._attempt_flusher is None:
+            self._flush_requested = asyncio.Event()
+            self._attempt_flusher = asyncio.create_task(self._flush_attempts_loop())
+
+    async def _flush_attempts_loop(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.settings.attempt_flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush_buffered_writes()
+            except Exception:  # pragma: no cover - keep flushing after transient DB errors
+                logger.exception("Failed to write buffered fetch attempts and job failures")
+
+    async def flush_buffered_writes(self) -> None:
+        """Write buffered fetch attempts and failed-job updates in one transaction."""
+
+        attempts, self._attempt_buffer = self._attempt_buffer, []
+        failures, self._failed_job_buffer = self._failed_job_buffer, []
+        if not attempts and not failures:
+            return
+        try:
+            async with session_scope() as session:
+                for chunk in _chunks(attempts, INSERT_CHUNK_SIZE):
+                    await session.execute(insert(FetchAttemptModel).values(chunk))
+                if failures:
+                    # ORM bulk UPDATE by primary key: one executemany for every failed job.
+                    await session.execute(update(CrawlJobModel), failures)
+        except BaseException:
+            # Put the rows back ahead of anything buffered meanwhile, cancellation included, since both lists
+            # were swapped out above. Failed-job updates are always retried, since those jobs stay
+            # in_progress until written; audit rows give up after a cap.
+            self._flush_failures += 1
+            self._failed_job_buffer[:0] = failures
+            if self._flush_failures <= MAX_ATTEMPT_FLUSH_RETRIES:
+                self._attempt_buffer[:0] = attempts
+            else:
+                logger.error(
+                    "Dropping buffered fetch attempts after repeated flush failures",
+                    extra={"count": len(attempts)},
+                )
+            raise
+        self._flush_failures = 0
+
+    async def close(self) -> None:
+        """Stop the background attempt writer and flush whatever is still buffered."""
+
+        if self._attempt_flusher is not None:
+            # Join rather than cancel so an in-flight flush finishes (or requeues) before the final one.
+            self._closing = True
+            self._flush_requested.set()
+            await self._attempt_flusher
+            self._attempt_flusher = None
+            self._closing = False
+        await self.flush_buffered_writes()
 
     async def process_job(
         self,
@@ -183,17 +352,20 @@ class JobManager:
         client: httpx.AsyncClient,
         browser: Browser,
         proxy: Optional[str],
+        contexts: Optional[Dict[Optional[str], BrowserContext]] = None,
     ) -> List[Dict]:
         await self._respect_domain_delay(job.domain)
 
         base_url = f"https://{job.domain}"
         start_time = time.perf_counter()
         try:
-            response = await client.get(base_url, proxies=proxy)
-            status_code = response.status_code
-            html = response.text
+            async with client.stream("GET", base_url) as response:
+                status_code = response.status_code
+                # Decoding happens in the parser thread; only keep the raw body and its charset here.
+                encoding = response.encoding or "utf-8"
+                body = await _read_capped(response, self.settings.max_response_bytes)
         except Exception as exc:
-            await self._record_fetch_attempt(
+            self._record_fetch_attempt(
                 job,
                 proxy,
                 status_code=None,
@@ -207,8 +379,8 @@ class JobManager:
             elapsed_ms = int(elapsed_seconds * 1000)
             FETCH_LATENCY.observe(elapsed_seconds)
             success = status_code is not None and 200 <= status_code < 400
-            error_msg = None if success else html[:500]
-            await self._record_fetch_attempt(
+            error_msg = None if success else body[:2000].decode(encoding, errors="replace")[:500]
+            self._record_fetch_attempt(
                 job,
                 proxy,
                 status_code=status_code,
@@ -217,73 +389,160 @@ class JobManager:
                 response_time_ms=elapsed_ms,
             )
 
-        if looks_like_captcha(html):
+        # Parsing is CPU-bound; one thread hop keeps the event loop free for other jobs' network I/O.
+        captcha, links_by_platform, others, needs_render = await asyncio.to_thread(
+            _analyze_page, body, encoding, base_url
+        )
+        if captcha:
             raise RuntimeError("Encountered CAPTCHA")
 
-        links_by_platform, others = parse_social_links(html, base_url)
-
-        if is_js_heavy(html) and not any(links_by_platform.values()):
-            page = await browser.new_page(proxy={"server": proxy} if proxy else None)
+        if needs_render:
+            if contexts is None:
+                page = await browser.new_page(proxy={"server": proxy} if proxy else None)
+            else:
+                context = await self._get_browser_context(browser, contexts, proxy)
+                page = await context.new_page()
             try:
                 await page.goto(
                     base_url,
                     wait_until="networkidle",
                     timeout=self.settings.request_timeout_seconds * 1000,
                 )
-                html = await page.content()
-                links_by_platform, others = parse_social_links(html, base_url)
+                html = await page.evaluate(
+                    "limit => document.documentElement.outerHTML.slice(0, limit)",
+                    self.settings.max_response_bytes,
+                )
+                links_by_platform, others = await asyncio.to_thread(parse_social_links, html, base_url)
             finally:
                 await page.close()
 
-        results: List[Dict] = []
-        for platform, urls in links_by_platform.items():
-            for url in urls:
-                results.append({"url": url, "network": platform, "source_url": base_url})
-        for url in others:
-            results.append({"url": url, "network": None, "source_url": base_url})
-
+        results: List[Dict] = [
+            {"url": url, "network": platform, "source_url": base_url}
+            for platform, urls in links_by_platform.items()
+            for url in urls
+        ]
+        results.extend({"url": url, "network": None, "source_url": base_url} for url in others)
         return results
 
+    async def _get_browser_context(
+        self,
+        browser: Browser,
+        contexts: Dict[Optional[str], BrowserContext],
+        proxy: Optional[str],
+    ) -> BrowserContext:
+        """Return the reusable context for ``proxy``, creating it (and evicting the oldest) on a miss."""
+
+        context = contexts.pop(proxy, None)
+        if context is not None:
+            contexts[proxy] = context
+            return context
+        created = await browser.new_context(proxy={"server": proxy} if proxy else None)
+        # A concurrent miss for the same proxy may have stored its context during the await; keep that one.
+        # Dict updates happen before any further await so no other job can slip in between.
+        context = contexts.pop(proxy, None)
+        if context is not None:
+            contexts[proxy] = context
+            await created.close()
+            return context
+        contexts[proxy] = created
+        if len(contexts) > MAX_BROWSER_CONTEXTS:
+            # Concurrent jobs may be rendering in older contexts; only close one with no open pages.
+            idle = next(
+                (key for key, candidate in contexts.items() if key != proxy and not candidate.pages), _NO_CONTEXT
+            )
+            if idle is not _NO_CONTEXT:
+                await contexts.pop(idle).close()
+        return created
+
     async def mark_job_completed(self, job: CrawlJob, links: List[Dict]) -> None:
         async with session_scope() as session:
-            db_job = await session.get(CrawlJobModel, job.db_id)
-            if not db_job:
+            db_job_id = await session.scalar(
+                update(CrawlJobModel)
+                .where(CrawlJobModel.id == job.db_id)
+                .values(status="completed", completed_at=func.now(), last_error=None)
+                .returning(CrawlJobModel.id)
+            )
+            if db_job_id is None:
                 return
-            db_job.status = "completed"
-            db_job.completed_at = datetime.utcnow()
-            db_job.last_error = None
 
-            for link in links:
-                stmt = (
-                    insert(DiscoveredLinkModel)
-                    .values(
-                        job_id=db_job.id,
-                        url=link["url"],
-                        network=link.get("network"),
-                        source_url=link.get("source_url"),
+            if links:
+                rows = [
+                    {
+                        "job_id": db_job_id,
+                        "url": link["url"],
+                        "network": link.get("network"),
+                        "source_url": link.get("source_url"),
+                    }
+                    for link in links
+                ]
+                for chunk in _chunks(rows, INSERT_CHUNK_SIZE):
+                    await session.execute(
+                        insert(DiscoveredLinkModel)
+                        .values(chunk)
+                        .on_conflict_do_nothing(index_elements=[DiscoveredLinkModel.job_id, DiscoveredLinkModel.url])
                     )
-                    .on_conflict_do_nothing(index_elements=[DiscoveredLinkModel.job_id, DiscoveredLinkModel.url])
-                )
-                await session.execute(stmt)
             LINKS_DISCOVERED_TOTAL.inc(len(links))
 
         await self._release_domain_slot(job.domain)
         IN_PROGRESS_JOBS.dec()
 
     async def mark_job_failed(self, job: CrawlJob, error: str) -> None:
-        async with session_scope() as session:
-            db_job = await session.get(CrawlJobModel, job.db_id)
-            if not db_job:
-                return
-            if job.attempts >= self.settings.max_retries:
-                db_job.status = "failed"
-            else:
-                db_job.status = "retry"
-            db_job.last_error = error[:1000]
+        # The job stays in_progress in the database until the next flush, so it cannot be re-reserved early.
+        self._failed_job_buffer.append(
+            {
+                "id": job.db_id,
+                "status": "failed" if job.attempts >= self.settings.max_retries else "retry",
+                "last_error": error[:JOB_ERROR_MAX_LEN],
+            }
+        )
+        self._ensure_flusher()
         await self._release_domain_slot(job.domain)
         IN_PROGRESS_JOBS.dec()
 
 
+async def _read_capped(response: httpx.Response, limit: int) -> bytes:
+    """Read at most ``limit`` bytes of ``response``; the rest of an oversized body is never downloaded."""
+
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes(RESPONSE_CHUNK_SIZE):
+        buffer += chunk
+        if len(buffer) >= limit:
+            del buffer[limit:]
+            break
+    return bytes(buffer)
+
+
+def _analyze_page(
+    body: bytes, encoding: str, base_url: str
+) -> Tuple[bool, Dict[str, List[str]], List[str], bool]:
+    """Decode a fetched page and return ``(captcha, links_by_platform, others, needs_render)``."""
+
+    html = body.decode(encoding, errors="replace")
+    if looks_like_captcha(html):
+        return True, {}, [], False
+    links_by_platform, others = parse_social_links(html, base_url)
+    needs_render = not any(links_by_platform.values()) and is_js_heavy(html)
+    return False, links_by_platform, others, needs_render
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _job_from_model(db_job: CrawlJobModel) -> CrawlJob:
+    return CrawlJob(
+        job_id=db_job.job_id,
+        domain=db_job.hotel.domain,
+        status=db_job.status,
+        attempts=db_job.attempts,
+        last_error=db_job.last_error,
+        completed_at=db_job.completed_at,
+        metadata=db_job.job_metadata or {},
+        db_id=db_job.id,
+    )
+
+
 _global_manager: Optional[JobManager] = None
 
 
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from typing import Tuple
+
 from fastapi import APIRouter, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 
@@ -15,10 +19,30 @@ FETCH_LATENCY = Histogram("social_discovery_fetch_latency_seconds", "Latency for
 
 metrics_router = APIRouter()
 
+# Scrapes arriving within this window share one encoded snapshot instead of each walking every collector.
+METRICS_CACHE_SECONDS = 1.0
+_metrics_cache: Tuple[float, bytes] = (float("-inf"), b"")
+_metrics_lock = threading.Lock()
+
+
+def _latest_metrics() -> bytes:
+    global _metrics_cache
+    generated_at, payload = _metrics_cache
+    if time.monotonic() - generated_at < METRICS_CACHE_SECONDS:
+        return payload
+    with _metrics_lock:
+        # Another thread may have regenerated while this one waited for the lock.
+        generated_at, payload = _metrics_cache
+        now = time.monotonic()
+        if now - generated_at >= METRICS_CACHE_SECONDS:
+            payload = generate_latest()
+            _metrics_cache = (now, payload)
+        return payload
+
 
 @metrics_router.get("/metrics", include_in_schema=False)
 def metrics() -> Response:
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    return Response(_latest_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 def setup_metrics() -> None:
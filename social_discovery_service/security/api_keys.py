@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Dict, Iterable, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import APIKeyHeader
 
-from ..config import get_settings
+from ..config import Settings, get_settings
 
 
 class Role(str, Enum):
@@ -21,12 +23,29 @@ class Role(str, Enum):
 _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
-def _build_role_map() -> Dict[str, Role]:
+_role_map_cache: Optional[Tuple[Settings, Mapping[str, Role]]] = None
+
+
+def _build_role_map() -> Mapping[str, Role]:
+    """Return the key -> role map, rebuilt only when the settings instance changes."""
+
+    global _role_map_cache
     settings = get_settings()
+    if _role_map_cache is not None and _role_map_cache[0] is settings:
+        return _role_map_cache[1]
     role_map: Dict[str, Role] = {}
     role_map.update({key: Role.ADMIN for key in settings.admin_api_keys})
     role_map.update({key: Role.SUBMITTER for key in settings.submitter_api_keys})
-    return role_map
+    frozen = MappingProxyType(role_map)
+    _role_map_cache = (settings, frozen)
+    return frozen
+
+
+def reset_role_cache() -> None:
+    """Drop the cached role map so the next request rebuilds it from settings."""
+
+    global _role_map_cache
+    _role_map_cache = None
 
 
 def get_current_role(api_key: Optional[str] = Security(_api_key_header)) -> Role:
@@ -45,8 +64,12 @@ def get_current_role(api_key: Optional[str] = Security(_api_key_header)) -> Role
 def require_roles(*allowed_roles: Iterable[Role]):
     """FastAPI dependency to enforce role-based access control."""
 
-    allowed_set = {Role(role) for role in allowed_roles}
+    return _role_dependency(frozenset(Role(role) for role in allowed_roles))
+
 
+@lru_cache(maxsize=8)
+def _role_dependency(allowed_set: FrozenSet[Role]):
+    # One callable per role set lets FastAPI reuse the resolved dependency within a request.
     def _dependency(role: Role = Depends(get_current_role)) -> Role:
         if role not in allowed_set:
             raise HTTPException(status_code=403, detail="Insufficient permissions")
@@ -55,4 +78,4 @@ def require_roles(*allowed_roles: Iterable[Role]):
     return _dependency
 
 
-__all__ = ["Role", "get_current_role", "require_roles"]
+__all__ = ["Role", "get_current_role", "require_roles", "reset_role_cache"]
@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-import random
+import heapq
+import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
-from ..config import get_settings
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from ..config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Redis hash of proxy_url -> [failures, quarantined_until as a unix timestamp or null].
+PROXY_STATE_KEY = "social_discovery:proxy_state"
+# Keep an unreachable Redis from stalling the background writer (or restore) for the OS TCP timeout.
+PROXY_STATE_REDIS_TIMEOUT_SECONDS = 2.0
 
 
 @dataclass
@@ -20,45 +34,182 @@ class ProxyState:
     def is_available(self) -> bool:
         if self.quarantined_until is None:
             return True
-        return self.quarantined_until <= asyncio.get_event_loop().time()
+        return self.quarantined_until <= asyncio.get_running_loop().time()
 
 
 @dataclass
 class ProxyPool:
     proxies: Dict[str, ProxyState] = field(default_factory=dict)
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    settings: Settings = field(default_factory=get_settings, repr=False)
+    # Round-robin queue of usable proxies and a min-heap of (release_time, url) for quarantined ones,
+    # so picking a proxy never scans the whole pool.
+    _available: Deque[str] = field(default_factory=deque, init=False, repr=False)
+    _quarantine: List[Tuple[float, str]] = field(default_factory=list, init=False, repr=False)
+    _failure_threshold: int = field(init=False, repr=False)
+    _quarantine_seconds: float = field(init=False, repr=False)
+    _redis: Optional[Redis] = field(default=None, init=False, repr=False)
+    # Proxies whose state changed since the last write; a background task coalesces them into one HSET
+    # so record_failure/record_success never wait on Redis.
+    _dirty: Set[str] = field(default_factory=set, init=False, repr=False)
+    _persist_requested: Optional[asyncio.Event] = field(default=None, init=False, repr=False)
+    _persist_task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _closing: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._failure_threshold = self.settings.proxy_failure_threshold
+        self._quarantine_seconds = self.settings.proxy_quarantine_seconds
+        self._available.extend(url for url, state in self.proxies.items() if state.quarantined_until is None)
+
+    def _get_state(self, proxy_url: str) -> ProxyState:
+        state = self.proxies.get(proxy_url)
+        if state is None:
+            state = self.proxies[proxy_url] = ProxyState(proxy_url=proxy_url)
+            self._available.append(proxy_url)
+        return state
+
+    def _release_expired(self) -> None:
+        now = asyncio.get_running_loop().time()
+        while self._quarantine and self._quarantine[0][0] <= now:
+            release_at, proxy_url = heapq.heappop(self._quarantine)
+            state = self.proxies[proxy_url]
+            # Skip entries superseded by a longer quarantine or an earlier success.
+            if state.quarantined_until == release_at:
+                state.quarantined_until = None
+                self._available.append(proxy_url)
+
+    def _get_redis(self) -> Optional[Redis]:
+        if self._redis is None and self.settings.persist_proxy_state:
+            self._redis = Redis.from_url(
+                self.settings.redis_url,
+                socket_connect_timeout=PROXY_STATE_REDIS_TIMEOUT_SECONDS,
+                socket_timeout=PROXY_STATE_REDIS_TIMEOUT_SECONDS,
+            )
+        return self._redis
+
+    async def restore_state(self) -> int:
+        """Load failure counts and quarantines saved by earlier workers for the proxies in this pool."""
+
+        client = self._get_redis()
+        if client is None:
+            return 0
+        try:
+            saved = await client.hgetall(PROXY_STATE_KEY)
+        except RedisError as exc:
+            logger.warning("Could not restore proxy state: %s", exc)
+            return 0
+
+        # Quarantines are stored as wall-clock times; the pool schedules on the event loop clock.
+        loop_now = asyncio.get_running_loop().time()
+        wall_now = time.time()
+        restored = 0
+        async with self.lock:
+            for raw_url, raw_state in saved.items():
+                state = self.proxies.get(raw_url.decode())
+                if state is None:
+                    continue
+                state.failures, quarantined_until = orjson.loads(raw_state)
+                if quarantined_until is not None and quarantined_until > wall_now:
+                    if state.quarantined_until is None:
+                        self._available.remove(state.proxy_url)
+                    state.quarantined_until = loop_now + (quarantined_until - wall_now)
+                    heapq.heappush(self._quarantine, (state.quarantined_until, state.proxy_url))
+                restored += 1
+        return restored
+
+    def _persist(self, state: ProxyState) -> None:
+        if not self.settings.persist_proxy_state:
+            return
+        self._dirty.add(state.proxy_url)
+        if self._persist_task is None:
+            self._persist_requested = asyncio.Event()
+            self._persist_task = asyncio.create_task(self._persist_loop())
+        self._persist_requested.set()
+
+    async def _persist_loop(self) -> None:
+        while not self._closing:
+            await self._persist_requested.wait()
+            self._persist_requested.clear()
+            await self._write_dirty()
+
+    async def _write_dirty(self) -> None:
+        client = self._get_redis()
+        if client is None or not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        # Quarantines are saved as wall-clock times so other workers can map them onto their own loop clock.
+        loop_now = asyncio.get_running_loop().time()
+        wall_now = time.time()
+        mapping = {}
+        for proxy_url in dirty:
+            state = self.proxies[proxy_url]
+            quarantined_until = None
+            if state.quarantined_until is not None:
+                quarantined_until = wall_now + (state.quarantined_until - loop_now)
+            mapping[proxy_url] = orjson.dumps([state.failures, quarantined_until])
+        try:
+            await client.hset(PROXY_STATE_KEY, mapping=mapping)
+        except BaseException as exc:
+            # Values are read at write time, so requeueing the names is enough to retry with fresh state.
+            self._dirty |= dirty
+            if not isinstance(exc, RedisError):
+                raise
+            logger.warning("Could not persist state for %d proxies: %s", len(dirty), exc)
+
+    async def close(self) -> None:
+        if self._persist_task is not None:
+            # Join rather than cancel so an in-flight write finishes (or requeues) before the final one.
+            self._closing = True
+            self._persist_requested.set()
+            await self._persist_task
+            self._persist_task = None
+            self._closing = False
+            await self._write_dirty()
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
 
     def load_from_file(self, path: Path) -> int:
         lines = [line.strip() for line in path.read_text().splitlines() if line.strip()]
         for line in lines:
-            self.proxies.setdefault(line, ProxyState(proxy_url=line))
+            self._get_state(line)
         return len(lines)
 
     async def get_proxy(self) -> Optional[str]:
         async with self.lock:
-            available = [p for p in self.proxies.values() if p.is_available()]
-            if not available:
+            self._release_expired()
+            if not self._available:
                 return None
-            choice = random.choice(available)
-            return choice.proxy_url
+            self._available.rotate(-1)
+            return self._available[0]
 
     async def record_failure(self, proxy_url: Optional[str]) -> None:
         if not proxy_url:
             return
-        settings = get_settings()
+        release_at = asyncio.get_running_loop().time() + self._quarantine_seconds
         async with self.lock:
-            state = self.proxies.setdefault(proxy_url, ProxyState(proxy_url=proxy_url))
+            state = self._get_state(proxy_url)
             state.failures += 1
-            if state.failures >= settings.proxy_failure_threshold:
-                state.quarantined_until = asyncio.get_event_loop().time() + settings.proxy_quarantine_seconds
+            if state.failures >= self._failure_threshold:
+                if state.quarantined_until is None:
+                    self._available.remove(proxy_url)
+                state.quarantined_until = release_at
+                heapq.heappush(self._quarantine, (state.quarantined_until, proxy_url))
+        self._persist(state)
 
     async def record_success(self, proxy_url: Optional[str]) -> None:
         if not proxy_url:
             return
         async with self.lock:
-            state = self.proxies.setdefault(proxy_url, ProxyState(proxy_url=proxy_url))
+            state = self._get_state(proxy_url)
+            changed = state.failures != 0 or state.quarantined_until is not None
             state.failures = 0
-            state.quarantined_until = None
+            if state.quarantined_until is not None:
+                state.quarantined_until = None
+                self._available.append(proxy_url)
+        # Healthy proxies are the common case; only write when there was failure history to clear.
+        if changed:
+            self._persist(state)
 
 
 _global_pool: Optional[ProxyPool] = None
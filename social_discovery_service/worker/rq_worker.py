@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
-import asyncio
-
 from redis import Redis
 from rq import Queue
 
 from ..config import get_settings
 from ..jobs.manager import get_job_manager
-from .runner import run_worker
+from .runner import run_async, run_worker
 
 
 def process_single_job(job_id: str) -> None:
     manager = get_job_manager()
     settings = get_settings()
-    asyncio.run(run_worker(manager, queue="default", once=True, settings=settings))
+    run_async(run_worker(manager, queue="default", once=True, settings=settings))
 
 
 def enqueue_with_rq(job_id: str) -> None:
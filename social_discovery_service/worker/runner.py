@@ -4,18 +4,40 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional, TypeVar
+
 import httpx
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+try:  # pragma: no cover - uvloop ships with uvicorn[standard] but not on Windows
+    import uvloop
+except ImportError:  # pragma: no cover - fall back to the default event loop
+    uvloop = None  # type: ignore
+
+from hotel_social_discover.url_tools import HTTP2_AVAILABLE
 
 from ..config import Settings
 from ..jobs.checkpoint import CheckpointStore
 from ..jobs.manager import JobManager
+from ..jobs.models import CrawlJob
 from ..monitoring.metrics import WORKER_ERRORS, WORKER_JOBS_COMPLETED, WORKER_JOBS_FAILED
-from .proxy import get_proxy_pool
+from .proxy import ProxyPool, get_proxy_pool
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on uvloop when available, matching the loop Uvicorn serves the API on."""
+
+    if uvloop is not None:
+        # uvloop.run builds its own loop, leaving the (deprecated) global event loop policy alone.
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 
 @asynccontextmanager
 async def playwright_browser():
@@ -28,42 +50,153 @@ async def playwright_browser():
         await playwright.stop()
 
 
+async def _flush_checkpoints(checkpoint: CheckpointStore, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        checkpoint.flush()
+
+
 async def run_worker(manager: JobManager, queue: str, once: bool, settings: Settings) -> None:
+    # asyncio.to_thread uses the default executor; size it for the parser work process_job hands off.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=settings.parser_threads))
     proxy_pool = get_proxy_pool()
+    await proxy_pool.restore_state()
     checkpoint = CheckpointStore()
+    flusher = asyncio.create_task(_flush_checkpoints(checkpoint, settings.checkpoint_flush_seconds))
+    try:
+        await _run_jobs(manager, queue, once, settings, proxy_pool, checkpoint)
+    finally:
+        flusher.cancel()
+        checkpoint.flush()
+        await manager.close()
+        await proxy_pool.close()
+
+
+async def _run_jobs(
+    manager: JobManager,
+    queue: str,
+    once: bool,
+    settings: Settings,
+    proxy_pool: ProxyPool,
+    checkpoint: CheckpointStore,
+) -> None:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    timeout = httpx.Timeout(settings.request_timeout_seconds, connect=5.0)
+    client_options = dict(
+        http2=HTTP2_AVAILABLE,
+        limits=limits,
+        timeout=timeout,
+        headers={"User-Agent": settings.user_agent},
+    )
+    # Clients live for the worker's lifetime so keep-alive connections are reused across jobs.
+    # httpx binds proxies per client, so each proxy gets its own pooled client on first use.
+    async with AsyncExitStack() as stack:
+        direct_client = await stack.enter_async_context(httpx.AsyncClient(**client_options))
+        proxy_clients: Dict[str, httpx.AsyncClient] = {}
+
+        async def client_for(proxy: Optional[str]) -> httpx.AsyncClient:
+            if proxy is None:
+                return direct_client
+            client = proxy_clients.get(proxy)
+            if client is None:
+                client = proxy_clients[proxy] = await stack.enter_async_context(
+                    httpx.AsyncClient(proxy=proxy, **client_options)
+                )
+            return client
 
-    async with httpx.AsyncClient(timeout=settings.request_timeout_seconds) as client:
         async with playwright_browser() as browser:
-            while True:
-                job = await manager.reserve_next_job(queue)
-                if job is None:
+            # Contexts are reused across jobs (keyed by proxy) and closed together with the browser.
+            contexts: Dict[Optional[str], BrowserContext] = {}
+            # Reserved jobs wait here so DB reservation overlaps with consumers' HTTP work.
+            reserved: "asyncio.Queue[Optional[CrawlJob]]" = asyncio.Queue(maxsize=settings.worker_concurrency)
+
+            async def consume(worker_id: str) -> None:
+                while True:
+                    job = await reserved.get()
+                    if job is None:
+                        return
+                    try:
+                        await _process_reserved_job(
+                            job, worker_id, manager, proxy_pool, checkpoint, client_for, browser, contexts
+                        )
+                    except Exception:  # pragma: no cover - keep the consumer alive for the next job
+                        logger.exception("Worker could not settle job", extra={"job_id": job.job_id})
+                        WORKER_ERRORS.inc()
+
+            consumers = [
+                asyncio.create_task(consume(f"{queue}:{index}")) for index in range(settings.worker_concurrency)
+            ]
+            try:
+                while True:
+                    job = await manager.reserve_next_job(queue)
+                    if job is None:
+                        if once:
+                            break
+                        await asyncio.sleep(1)
+                        continue
+                    await reserved.put(job)
                     if once:
                         break
-                    await asyncio.sleep(1)
-                    continue
-
-                proxy = await proxy_pool.get_proxy()
-                logger.info("Processing job", extra={"job_id": job.job_id, "domain": job.domain, "proxy": proxy})
-                checkpoint.update_job(queue, job.job_id)
-
-                try:
-                    result = await manager.process_job(job, client=client, browser=browser, proxy=proxy)
-                except Exception as exc:  # pragma: no cover - worker level guard
-                    logger.exception("Job failed", extra={"job_id": job.job_id})
-                    WORKER_ERRORS.inc()
-                    await proxy_pool.record_failure(proxy)
-                    await manager.mark_job_failed(job, str(exc))
-                else:
-                    if result:
-                        WORKER_JOBS_COMPLETED.inc()
-                        await proxy_pool.record_success(proxy)
-                        await manager.mark_job_completed(job, result)
-                    else:
-                        WORKER_JOBS_FAILED.inc()
-                        await proxy_pool.record_failure(proxy)
-                        await manager.mark_job_failed(job, "No links discovered")
-
-                checkpoint.clear_job(queue)
-
-                if once:
-                    break
+                for _ in consumers:
+                    await reserved.put(None)
+                await asyncio.gather(*consumers)
+            finally:
+                for consumer in consumers:
+                    consumer.cancel()
+
+
+async def _process_reserved_job(
+    job: CrawlJob,
+    worker_id: str,
+    manager: JobManager,
+    proxy_pool: ProxyPool,
+    checkpoint: CheckpointStore,
+    client_for: Callable[[Optional[str]], Awaitable[httpx.AsyncClient]],
+    browser: Browser,
+    contexts: Dict[Optional[str], BrowserContext],
+) -> None:
+    proxy: Optional[str] = None
+    result: List[Dict] = []
+    error: Optional[str] = None
+    try:
+        proxy = await proxy_pool.get_proxy()
+        logger.info("Processing job", extra={"job_id": job.job_id, "domain": job.domain, "proxy": proxy})
+        checkpoint.update_job(worker_id, job.job_id)
+        client = await client_for(proxy)
+        result = await manager.process_job(job, client=client, browser=browser, proxy=proxy, contexts=contexts)
+    except Exception as exc:  # pragma: no cover - worker level guard
+        logger.exception("Job failed", extra={"job_id": job.job_id})
+        WORKER_ERRORS.inc()
+        error = str(exc)
+    else:
+        if result:
+            WORKER_JOBS_COMPLETED.inc()
+        else:
+            WORKER_JOBS_FAILED.inc()
+            error = "No links discovered"
+
+    # Proxy bookkeeping is best effort; it must not keep the job from being settled below.
+    try:
+        if error is None:
+            await proxy_pool.record_success(proxy)
+        else:
+            await proxy_pool.record_failure(proxy)
+    except Exception:  # pragma: no cover - e.g. Redis unavailable
+        logger.exception("Could not record proxy outcome", extra={"proxy": proxy})
+
+    # Settling the job releases its domain slot; if storing the results fails, fall back to the
+    # buffered failure path so the slot is still released and the job is retried.
+    if error is None:
+        try:
+            await manager.mark_job_completed(job, result)
+        except Exception as exc:  # pragma: no cover - database errors
+            logger.exception("Could not store job results", extra={"job_id": job.job_id})
+            await manager.mark_job_failed(job, f"Could not store results: {exc}")
+    else:
+        await manager.mark_job_failed(job, error)
+
+    checkpoint.clear_job(worker_id)
@@ -10,26 +10,48 @@ YouTube, X/Twitter, and LinkedIn.
 import argparse
 import asyncio
 import csv
+import multiprocessing
+import os
 import re
 import sys
 import unicodedata
 from collections import Counter
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import unquote, urlparse
+from concurrent.futures import Executor, ProcessPoolExecutor
+from html import unescape
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import unquote
 
 # --- Optional dependencies ---
 try:  # pragma: no cover - runtime dependency guidance
     import httpx
     import pandas as pd
-    from bs4 import BeautifulSoup
 except ImportError as exc:  # pragma: no cover - runtime dependency guidance
-    NEED = "httpx beautifulsoup4 pandas"
+    NEED = "httpx[http2] pandas"
     print(
         f"Missing dependency: {exc}. Install with:  pip install {NEED}",
         file=sys.stderr,
     )
     sys.exit(1)
 
+try:  # pragma: no cover - optional faster CSV parser
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover - fall back to pandas' C parser
+    CSV_ENGINE = "c"
+
+try:  # pragma: no cover - optional dependency installed by the httpx[http2] extra
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - fall back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+try:  # pragma: no cover - optional SIMD multi-pattern matcher
+    import hyperscan
+except ImportError:  # pragma: no cover - the stdlib re alternations are used instead
+    hyperscan = None
+
 
 # -------------------- Config & Patterns --------------------
 USER_AGENTS = [
@@ -43,6 +65,18 @@ USER_AGENTS = [
     "(KHTML, like Gecko) Version/17.0 Safari/605.1.15",
 ]
 
+# Classification only inspects the head of a page; fetch() stops reading here.
+# SmallBody (< 800 chars) is unaffected since truncation never goes below it.
+MAX_CLASSIFY_BYTES = 64 * 1024
+STREAM_CHUNK_SIZE = 8192
+# Stopping an HTTP/1.1 body early closes its connection; remainders up to this size are read instead so the
+# connection goes back to the pool. HTTP/2 streams are reset without losing the connection.
+MAX_DRAIN_BYTES = 256 * 1024
+# Statuses that settle a URL as dead without looking at the body.
+DEAD_STATUS_CODES = frozenset({404, 410})
+# Auth statuses; also settled without a body under --login-wall-as-inactive.
+AUTH_STATUS_CODES = frozenset({401, 403})
+
 # Sign-in/cookie walls — default to Unknown (unless --login-wall-as-inactive)
 LOGIN_WALL_HINTS = [
     r"you must log in to continue",
@@ -95,51 +129,176 @@ LINKEDIN_DEAD_I18N = [
     r"strona nie została znaleziona|ta strona nie istnieje",
 ]
 
-ERROR_PATTERNS: Dict[str, List[re.Pattern]] = {
+ERROR_PATTERN_SOURCES: Dict[str, List[str]] = {
     "instagram": [
-        re.compile(pat, re.IGNORECASE)
-        for pat in [
-            r"sorry, this page isn.?t available",
-            r"the link you followed may be broken",
-            r"page may have been removed",
-            r"page not found",
-            r"this page could not be found",
-            r"404 not found",
-        ]
+        r"sorry, this page isn.?t available",
+        r"the link you followed may be broken",
+        r"page may have been removed",
+        r"page not found",
+        r"this page could not be found",
+        r"404 not found",
     ],
-    "facebook": [re.compile(pat, re.IGNORECASE) for pat in FB_DEAD_I18N],
+    "facebook": FB_DEAD_I18N,
     "tiktok": [
-        re.compile(pat, re.IGNORECASE)
-        for pat in [
-            r"couldn.?t find this account",
-            r"video (currently )?unavailable",
-            r"page not available",
-            r"this account has been suspended",
-            r"404 not found",
-        ]
+        r"couldn.?t find this account",
+        r"video (currently )?unavailable",
+        r"page not available",
+        r"this account has been suspended",
+        r"404 not found",
     ],
     "youtube": [
-        re.compile(pat, re.IGNORECASE)
-        for pat in [
-            r"this channel does not exist",
-            r"(video|content) unavailable",
-            r"this page isn.?t available",
-            r"404 not found",
-            r"this account has been terminated",
-        ]
+        r"this channel does not exist",
+        r"(video|content) unavailable",
+        r"this page isn.?t available",
+        r"404 not found",
+        r"this account has been terminated",
     ],
     "x": [
-        re.compile(pat, re.IGNORECASE)
-        for pat in [
-            r"this account doesn.?t exist",
-            r"account suspended",
-            r"page doesn.?t exist|page not found",
-            r"404 not found",
-        ]
+        r"this account doesn.?t exist",
+        r"account suspended",
+        r"page doesn.?t exist|page not found",
+        r"404 not found",
     ],
-    "linkedin": [re.compile(pat, re.IGNORECASE) for pat in LINKEDIN_DEAD_I18N],
+    "linkedin": LINKEDIN_DEAD_I18N,
 }
 
+
+class _FoldTable(dict):
+    """str.translate table filled on first sight of each codepoint.
+
+    Scanning all of Unicode up front cost every classify worker process a
+    noticeable start-up delay; pages only ever use a few hundred codepoints.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        folded = None if unicodedata.combining(chr(codepoint)) else codepoint
+        self[codepoint] = folded
+        return folded
+
+
+# str.translate table dropping every combining mark left behind by NFKD and
+# folding typographic quotes to ASCII, so most pages stay in CPython's compact
+# one-byte string form for the regex scans.
+TEXT_FOLD_TABLE = _FoldTable()
+TEXT_FOLD_TABLE.update(dict.fromkeys(map(ord, "\u2018\u2019\u201a\u201b"), "'"))
+TEXT_FOLD_TABLE.update(dict.fromkeys(map(ord, "\u201c\u201d\u201e\u201f"), '"'))
+
+
+def fold_text(text: str) -> str:
+    """NFKD-decompose ``text`` and strip accents/typographic quotes (case is kept)."""
+
+    return unicodedata.normalize("NFKD", text).translate(TEXT_FOLD_TABLE)
+
+
+def compile_alternation(patterns: List[str]) -> re.Pattern:
+    """Fold ``patterns`` into one case-insensitive regex scanned in a single pass.
+
+    Each alternative is wrapped in a named group ``p<index>`` so callers can map
+    ``match.lastgroup`` back to the source pattern that fired, and is passed
+    through ``fold_text`` so accented copy lines up with the folded page text.
+    Every part is compiled on its own first so a bad entry fails at import with
+    its text in the error, rather than somewhere inside the combined expression.
+    """
+
+    for pattern in patterns:
+        try:
+            re.compile(pattern, re.IGNORECASE)
+        except re.error as exc:
+            raise ValueError(f"Invalid classifier pattern {pattern!r}: {exc}") from exc
+    return re.compile(
+        "|".join(f"(?P<p{index}>{fold_text(pattern)})" for index, pattern in enumerate(patterns)),
+        re.IGNORECASE,
+    )
+
+
+def compile_hyperscan(patterns: List[str]) -> Optional["hyperscan.Database"]:
+    """Build a block-mode Hyperscan database for ``patterns`` when available.
+
+    Returns ``None`` if hyperscan is not installed or rejects a pattern, in
+    which case callers fall back to the ``compile_alternation`` regex.
+    """
+
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[fold_text(pattern).encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.HyperscanError:  # pragma: no cover - unsupported syntax
+        return None
+    return database
+
+
+def first_hit(pattern: re.Pattern, database: Optional["hyperscan.Database"], text: str) -> Optional[int]:
+    """Return the index of a folded pattern found in ``text``, or ``None``."""
+
+    if database is None:
+        match = pattern.search(text)
+        return int(match.lastgroup[1:]) if match else None
+
+    hits: List[int] = []
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> bool:
+        hits.append(pattern_id)
+        return True  # stop at the first hit
+
+    try:
+        database.scan(text.encode("utf-8", "ignore"), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return hits[0] if hits else None
+
+
+LOGIN_WALL_RE = compile_alternation(LOGIN_WALL_HINTS)
+LOGIN_WALL_DB = compile_hyperscan(LOGIN_WALL_HINTS)
+
+# pattern_hit joins the text, title and meta fields with this separator and scans them once.
+FIELD_SEPARATOR = "\x1f"
+
+
+def within_field(pattern: str) -> str:
+    """Make each unescaped ``.`` exclude FIELD_SEPARATOR so a match cannot span two joined fields.
+
+    The error patterns only use ``.`` as a bare wildcard (never inside a
+    character class), which is what makes this plain rewrite safe.
+    """
+
+    return re.sub(r"(?<!\\)\.", r"[^\\x1f]", pattern)
+
+
+# One compiled alternation (and Hyperscan database) per platform; see
+# ERROR_PATTERN_SOURCES for the parts.
+ERROR_PATTERNS: Dict[str, re.Pattern] = {
+    platform: compile_alternation([within_field(pattern) for pattern in patterns])
+    for platform, patterns in ERROR_PATTERN_SOURCES.items()
+}
+ERROR_PATTERN_DBS: Dict[str, Optional["hyperscan.Database"]] = {
+    platform: compile_hyperscan([within_field(pattern) for pattern in patterns])
+    for platform, patterns in ERROR_PATTERN_SOURCES.items()
+}
+
+# Lightweight head scraping; classify() only needs <title> and meta values, not a DOM.
+TITLE_RE = re.compile(r"<title\b[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+META_VALUE_RE = re.compile(r"""(?<=\s)(?:content|value)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+
+# Host -> platform in one match; the named group that fires is the platform.
+PLATFORM_HOST_RE = re.compile(
+    r"[a-z][a-z0-9+.-]*://(?:[^/?#@]*@)?(?:[^/?#:@]*\.)?"
+    r"(?:(?P<instagram>instagram\.com)"
+    r"|(?P<facebook>facebook\.com|fb\.watch)"
+    r"|(?P<tiktok>tiktok\.com)"
+    r"|(?P<youtube>youtube\.com|youtu\.be)"
+    r"|(?P<x>x\.com|twitter\.com)"
+    r"|(?P<linkedin>linkedin\.com))"
+    r"\.?(?=[:/?#]|$)",
+    re.IGNORECASE,
+)
+
 URL_CANDIDATES = [
     "urls",
     "url",
@@ -172,43 +331,45 @@ LOC_CANDIDATES = [
 def normalize_text(text: str) -> str:
     if not text:
         return ""
-    text = text.lower()
-    text = unicodedata.normalize("NFKD", text)
-    return "".join(ch for ch in text if not unicodedata.combining(ch))
+    return fold_text(text.lower())
+
+
+def extract_title(html_text: str) -> str:
+    match = TITLE_RE.search(html_text or "")
+    return unescape(match.group(1)).strip() if match else ""
+
+
+def extract_meta_values(html_text: str) -> List[str]:
+    values = []
+    for tag in META_TAG_RE.findall(html_text or ""):
+        for quoted, single, bare in META_VALUE_RE.findall(tag):
+            value = quoted or single or bare
+            if value:
+                values.append(unescape(value))
+    return values
 
 
 def guess_platform(url: str) -> str:
-    try:
-        host = urlparse(url).netloc.lower()
-    except Exception:  # pragma: no cover - defensive guard
-        return "unknown"
-    if "instagram.com" in host:
-        return "instagram"
-    if "facebook.com" in host or "fb.watch" in host:
-        return "facebook"
-    if "tiktok.com" in host:
-        return "tiktok"
-    if "youtube.com" in host or "youtu.be" in host:
-        return "youtube"
-    if "x.com" in host or "twitter.com" in host:
-        return "x"
-    if "linkedin.com" in host:
-        return "linkedin"
-    return "unknown"
+    match = PLATFORM_HOST_RE.match(url)
+    return match.lastgroup if match else "unknown"
 
 
 def looks_like_login_wall(text_norm: str) -> bool:
-    return any(re.search(pattern, text_norm, re.IGNORECASE) for pattern in LOGIN_WALL_HINTS)
+    return first_hit(LOGIN_WALL_RE, LOGIN_WALL_DB, text_norm) is not None
 
 
 def pattern_hit(
     platform: str, text_norm: str, title_norm: str, metas_norm: str
 ) -> Tuple[bool, str]:
-    patterns = ERROR_PATTERNS.get(platform, [])
-    for pattern in patterns:
-        if pattern.search(text_norm) or pattern.search(title_norm) or pattern.search(metas_norm):
-            return True, pattern.pattern
-    return False, ""
+    pattern = ERROR_PATTERNS.get(platform)
+    if pattern is None:
+        return False, ""
+    # One scan over all three fields; ERROR_PATTERNS are built so no match crosses FIELD_SEPARATOR
+    haystack = FIELD_SEPARATOR.join((text_norm, title_norm, metas_norm))
+    index = first_hit(pattern, ERROR_PATTERN_DBS[platform], haystack)
+    if index is None:
+        return False, ""
+    return True, ERROR_PATTERN_SOURCES[platform][index]
 
 
 # --- FB-specific soft 404 cues (beyond copy), incl. about/reviews shells ---
@@ -219,27 +380,44 @@ FB_SOFT404_CUES = [
     r'property="og:url" content="https://www\.facebook\.com/unsupportedbrowser',
     r'http-equiv="refresh"',
 ]
+FB_SOFT404_RE = compile_alternation(FB_SOFT404_CUES)
+FB_SOFT404_DB = compile_hyperscan(FB_SOFT404_CUES)
+
+
+def compile_classifier(platform: str) -> Tuple[re.Pattern, Optional["hyperscan.Database"]]:
+    """Fuse the login-wall, error and (FB) soft-404 patterns for one platform.
+
+    Hit indexes below ``len(LOGIN_WALL_HINTS)`` are login-wall hints.
+    """
+
+    sources = LOGIN_WALL_HINTS + ERROR_PATTERN_SOURCES.get(platform, [])
+    if platform == "facebook":
+        sources = sources + FB_SOFT404_CUES
+    return compile_alternation(sources), compile_hyperscan(sources)
 
 
-def extra_facebook_dead_signals(html: str) -> bool:
-    html_normalized = normalize_text(html)
-    if any(re.search(pattern, html, re.IGNORECASE) for pattern in FB_SOFT404_CUES):
+CLASSIFIER_PATTERNS: Dict[str, Tuple[re.Pattern, Optional["hyperscan.Database"]]] = {
+    platform: compile_classifier(platform) for platform in [*ERROR_PATTERN_SOURCES, "unknown"]
+}
+
+
+def extra_facebook_dead_signals(html: str, html_normalized: str, title_normalized: str) -> bool:
+    """Facebook soft-404 checks; takes the text/title ``classify`` already normalized."""
+
+    if first_hit(FB_SOFT404_RE, FB_SOFT404_DB, html or "") is not None:
         return True
-    try:
-        soup = BeautifulSoup(html or "", "html.parser")
-        title = soup.title.string if soup.title and soup.title.string else ""
-        title_normalized = normalize_text(title)
-        body_len = len(html_normalized)
-        if (
-            "facebook" in title_normalized
-            and body_len < 2000
-            and "profile" not in html_normalized
-            and "page" not in html_normalized
-        ):
-            return True
-    except Exception:  # pragma: no cover - soup failures are non-fatal
-        pass
-    return False
+    return facebook_shell_page(html_normalized, title_normalized)
+
+
+def facebook_shell_page(html_normalized: str, title_normalized: str) -> bool:
+    """Bare "Facebook" shell with no profile/page content (about/reviews tabs)."""
+
+    return (
+        "facebook" in title_normalized
+        and len(html_normalized) < 2000
+        and "profile" not in html_normalized
+        and "page" not in html_normalized
+    )
 
 
 def classify(
@@ -257,65 +435,107 @@ def classify(
         if "%20" in url or decoded.endswith((" ", "\u00A0")):
             return "Inactive", "InvalidHandle(%20/space)"
 
+    # Definitive statuses need no body inspection
+    if status_code in DEAD_STATUS_CODES:
+        return "Inactive", f"HTTP {status_code}"
+    if login_wall_as_inactive and status_code in AUTH_STATUS_CODES:
+        return "Inactive", f"HTTP {status_code}"
+
     text_norm = normalize_text(html_text)
 
-    # Parse title + meta for stronger signals
-    title_norm = ""
-    metas_norm = ""
-    try:
-        soup = BeautifulSoup(html_text or "", "html.parser")
-        title_norm = normalize_text(soup.title.string) if soup.title and soup.title.string else ""
-        meta_values = []
-        for meta_tag in soup.find_all("meta"):
-            for key in ("content", "value"):
-                value = meta_tag.get(key)
-                if value:
-                    meta_values.append(str(value))
-        metas_norm = normalize_text(" ".join(meta_values))
-    except Exception:  # pragma: no cover - soup failures are non-fatal
-        pass
+    # Pull title + meta for stronger signals
+    title_norm = normalize_text(extract_title(html_text))
+    metas_norm = normalize_text(" ".join(extract_meta_values(html_text)))
 
-    # Login/consent walls
+    # One fused scan clears most live pages; a hit falls through to the
+    # per-category checks below, which keep their original precedence.
     combined_norm = " ".join([text_norm, title_norm, metas_norm])
-    if looks_like_login_wall(combined_norm):
-        return ("Inactive" if login_wall_as_inactive else "Unknown", "LoginWall")
-
-    # Platform pattern hits
-    hit, pattern = pattern_hit(platform, text_norm, title_norm, metas_norm)
-    if hit:
-        return "Inactive", pattern
-
-    # FB soft-404 extras (about/reviews often land here)
-    if platform == "facebook" and extra_facebook_dead_signals(html_text):
+    fused_re, fused_db = CLASSIFIER_PATTERNS.get(platform, CLASSIFIER_PATTERNS["unknown"])
+    fused_hit = first_hit(fused_re, fused_db, combined_norm)
+    if fused_hit is not None:
+        # Login/consent walls
+        if fused_hit < len(LOGIN_WALL_HINTS) or looks_like_login_wall(combined_norm):
+            return ("Inactive" if login_wall_as_inactive else "Unknown", "LoginWall")
+
+        # Platform pattern hits
+        hit, pattern = pattern_hit(platform, text_norm, title_norm, metas_norm)
+        if hit:
+            return "Inactive", pattern
+
+        # FB soft-404 extras (about/reviews often land here)
+        if platform == "facebook" and extra_facebook_dead_signals(html_text, text_norm, title_norm):
+            return "Inactive", "FBSoft404"
+    elif platform == "facebook" and facebook_shell_page(text_norm, title_norm):
         return "Inactive", "FBSoft404"
 
     # HTTP heuristics
-    if status_code == 404:
-        return "Inactive", "HTTP 404"
     if 200 <= status_code < 400:
         if len(html_text) < 800:
             return "Unknown", f"SmallBody({len(html_text)})"
         return "Active", ""
-    if status_code in (401, 403):
-        return ("Inactive" if login_wall_as_inactive else "Unknown", f"HTTP {status_code}")
     return "Unknown", f"HTTP {status_code}"
 
 
+async def drain_small_remainder(response: "httpx.Response", chunks: AsyncIterator[bytes]) -> None:
+    """Finish reading an HTTP/1.1 body when little is left, so closing it keeps the connection alive."""
+
+    if response.http_version != "HTTP/1.1":
+        return
+    start = response.num_bytes_downloaded
+    length = response.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) - start > MAX_DRAIN_BYTES:
+        return
+    try:
+        async for _ in chunks:
+            if response.num_bytes_downloaded - start > MAX_DRAIN_BYTES:
+                return
+    except Exception:  # pragma: no cover - the page is already classified; only the connection is lost
+        pass
+
+
 async def fetch(
-    client: "httpx.AsyncClient", url: str, timeout: float, retries: int = 2, backoff: float = 0.75
+    client: "httpx.AsyncClient",
+    url: str,
+    timeout: float,
+    retries: int = 2,
+    backoff: float = 0.75,
+    *,
+    bodyless_statuses: FrozenSet[int] = DEAD_STATUS_CODES,
+    head_first: bool = False,
 ) -> Tuple[int, str]:
+    """Return (status, capped page text); the body is skipped for ``bodyless_statuses``.
+
+    With ``head_first`` a HEAD probe runs before the GET so those statuses are
+    settled without the server sending a body at all.
+    """
+
     for attempt in range(retries + 1):
+        # The client's default headers cover the first try; retries rotate the UA
+        headers = {"User-Agent": USER_AGENTS[attempt % len(USER_AGENTS)]} if attempt else None
         try:
-            response = await client.get(
+            if head_first:
+                head = await client.head(url, follow_redirects=True, timeout=timeout, headers=headers)
+                if head.status_code in bodyless_statuses:
+                    return head.status_code, ""
+            async with client.stream(
+                "GET",
                 url,
                 follow_redirects=True,
                 timeout=timeout,
-                headers={
-                    "User-Agent": USER_AGENTS[attempt % len(USER_AGENTS)],
-                    "Accept-Language": "en-US,en;q=0.8",
-                },
-            )
-            return response.status_code, response.text or ""
+                headers=headers,
+            ) as response:
+                if response.status_code in bodyless_statuses:
+                    await drain_small_remainder(response, response.aiter_raw(STREAM_CHUNK_SIZE))
+                    return response.status_code, ""
+                body = bytearray()
+                chunks = response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE)
+                async for chunk in chunks:
+                    body.extend(chunk)
+                    if len(body) >= MAX_CLASSIFY_BYTES:
+                        await drain_small_remainder(response, chunks)
+                        break
+                text = body[:MAX_CLASSIFY_BYTES].decode(response.encoding or "utf-8", errors="replace")
+                return response.status_code, text
         except Exception:  # pragma: no cover - network flakes fall through to retry
             if attempt < retries:
                 await asyncio.sleep(backoff * (2**attempt))
@@ -323,38 +543,67 @@ async def fetch(
 
 
 # -------------------- Pipeline --------------------
+async def check_url(
+    client: "httpx.AsyncClient",
+    executor: Executor,
+    url: str,
+    platform: str,
+    timeout: float,
+    login_wall_as_inactive: bool,
+    head_first: bool = False,
+) -> Tuple[int, str, str]:
+    """Return (HTTP status, Status, DetectedPattern) for one URL."""
+
+    # Statuses classify() settles on their own need no body
+    bodyless_statuses = DEAD_STATUS_CODES | AUTH_STATUS_CODES if login_wall_as_inactive else DEAD_STATUS_CODES
+    status_code, html = await fetch(client, url, timeout, bodyless_statuses=bodyless_statuses, head_first=head_first)
+    # Classification is CPU-bound; keep it off the loop so fetches keep flowing
+    status, pattern = await asyncio.get_running_loop().run_in_executor(
+        executor, classify, platform, html, status_code, login_wall_as_inactive, url
+    )
+    return status_code, status, pattern
+
+
 async def worker(
     name: int,
     queue: "asyncio.Queue",
     client: "httpx.AsyncClient",
+    executor: Executor,
     timeout: float,
-    results: List[dict],
-    url_col: str,
-    loc_col: Optional[str],
+    results: List[Optional[dict]],
+    url_checks: Dict[str, "asyncio.Task"],
+    status_counts: Counter,
+    platform_breakdown: Counter,
     login_wall_as_inactive: bool,
+    head_first: bool = False,
 ) -> None:
     while True:
         item = await queue.get()
         if item is None:
             queue.task_done()
             break
-        idx, row = item
-        url = str(row.get(url_col, "")).strip()
-        loccorp = row.get(loc_col, "") if loc_col else ""
+        idx, raw_url, loccorp = item
+        url = str(raw_url).strip()
         platform = guess_platform(url)
-        status_code, html = await fetch(client, url, timeout)
-        status, pattern = classify(platform, html, status_code, login_wall_as_inactive, url)
-        results.append(
-            {
-                "row_index": idx,
-                "Location/Corporate": loccorp,
-                "URL": url,
-                "Platform": platform,
-                "HTTP_Status": status_code,
-                "DetectedPattern": pattern,
-                "Status": status,
-            }
-        )
+        # Duplicate URLs share the first worker's check instead of refetching
+        check = url_checks.get(url)
+        if check is None:
+            check = url_checks[url] = asyncio.create_task(
+                check_url(client, executor, url, platform, timeout, login_wall_as_inactive, head_first)
+            )
+        status_code, status, pattern = await check
+        results[idx] = {
+            "row_index": idx,
+            "Location/Corporate": loccorp,
+            "URL": url,
+            "Platform": platform,
+            "HTTP_Status": status_code,
+            "DetectedPattern": pattern,
+            "Status": status,
+        }
+        # Summary tallies ride along; workers share one loop so no lock is needed
+        status_counts[status] += 1
+        platform_breakdown[platform] += 1
         queue.task_done()
 
 
@@ -374,7 +623,7 @@ def autodetect_column(
 
 
 async def main_async(args: argparse.Namespace) -> None:
-    df = pd.read_csv(args.input_csv)
+    df = pd.read_csv(args.input_csv, engine=CSV_ENGINE)
     url_col = args.url_col or autodetect_column(df, URL_CANDIDATES, ["url", "link"])
     if not url_col:
         print(
@@ -387,38 +636,55 @@ async def main_async(args: argparse.Namespace) -> None:
         df, LOC_CANDIDATES, ["location", "property", "hotel", "name", "brand"]
     )
 
-    queue: "asyncio.Queue" = asyncio.Queue()
-    for item in df.iterrows():
-        await queue.put(item)
-    for _ in range(args.concurrency):
-        await queue.put(None)
-
-    results: List[dict] = []
+    urls = df[url_col].tolist()
+    locations = df[loc_col].tolist() if loc_col else [""] * len(urls)
+    # Bounded so workers start on the first rows while the rest are still queued
+    queue: "asyncio.Queue" = asyncio.Queue(maxsize=args.concurrency * 4)
+
+    # Workers fill their own row slot, so results come out already in input order
+    results: List[Optional[dict]] = [None] * len(urls)
+    url_checks: Dict[str, "asyncio.Task"] = {}
+    status_counts: Counter = Counter()
+    platform_breakdown: Counter = Counter()
+    # Headroom above --concurrency so bursts at one host don't starve the others
     limits = httpx.Limits(
-        max_keepalive_connections=args.concurrency,
-        max_connections=args.concurrency,
+        max_keepalive_connections=args.concurrency * 2,
+        max_connections=args.concurrency * 4,
+        keepalive_expiry=30.0,
     )
-    async with httpx.AsyncClient(limits=limits) as client:
-        workers = [
-            asyncio.create_task(
-                worker(
-                    worker_id,
-                    queue,
-                    client,
-                    args.timeout,
-                    results,
-                    url_col,
-                    loc_col,
-                    args.login_wall_as_inactive,
+    default_headers = {"User-Agent": USER_AGENTS[0], "Accept-Language": "en-US,en;q=0.8"}
+    classify_workers = args.classify_workers or os.cpu_count() or 1
+    # The loop's helper threads already exist here, so forking them is unsafe; start workers cleanly instead.
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    mp_context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=classify_workers, mp_context=mp_context) as executor:
+        async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits, headers=default_headers) as client:
+            workers = [
+                asyncio.create_task(
+                    worker(
+                        worker_id,
+                        queue,
+                        client,
+                        executor,
+                        args.timeout,
+                        results,
+                        url_checks,
+                        status_counts,
+                        platform_breakdown,
+                        args.login_wall_as_inactive,
+                        args.head_first,
+                    )
                 )
-            )
-            for worker_id in range(args.concurrency)
-        ]
-        await queue.join()
-        for worker_task in workers:
-            await worker_task
+                for worker_id in range(args.concurrency)
+            ]
+            for item in zip(range(len(urls)), urls, locations):
+                await queue.put(item)
+            for _ in range(args.concurrency):
+                await queue.put(None)
+            await queue.join()
+            for worker_task in workers:
+                await worker_task
 
-    results_sorted = sorted(results, key=lambda r: r["row_index"])
     fields = [
         "row_index",
         "Location/Corporate",
@@ -429,13 +695,8 @@ async def main_async(args: argparse.Namespace) -> None:
         "Status",
     ]
 
-    with open(args.output_csv, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fields)
-        writer.writeheader()
-        writer.writerows(results_sorted)
-
-    status_counts = Counter(result["Status"] for result in results_sorted)
-    platform_breakdown = Counter(result["Platform"] for result in results_sorted)
+    results_df = pd.DataFrame(results, columns=fields)
+    results_df.to_csv(args.output_csv, index=False, encoding="utf-8")
 
     total_urls = df[url_col].shape[0]
     unique_urls = df[url_col].nunique(dropna=True)
@@ -446,37 +707,28 @@ async def main_async(args: argparse.Namespace) -> None:
         unique_loc = df[loc_col].nunique(dropna=True)
         duplicate_loc = total_loc - unique_loc
 
+    summary_rows: List[list] = [
+        ["Metric", "Value"],
+        ["Total URLs", total_urls],
+        ["Unique URLs", unique_urls],
+        ["Duplicate URLs", duplicate_urls],
+    ]
+    if loc_col:
+        summary_rows += [
+            ["Total Location/Corporate", total_loc],
+            ["Unique Location/Corporate", unique_loc],
+            ["Duplicate Location/Corporate", duplicate_loc],
+        ]
+    # Counters fill in completion order; sort so reruns produce the same file
+    summary_rows += [[], ["Status", "Count"], *map(list, sorted(status_counts.items()))]
+    summary_rows += [[], ["Platform", "Count"], *map(list, sorted(platform_breakdown.items()))]
     with open(args.summary_csv, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(["Metric", "Value"])
-        writer.writerow(["Total URLs", total_urls])
-        writer.writerow(["Unique URLs", unique_urls])
-        writer.writerow(["Duplicate URLs", duplicate_urls])
-        if loc_col:
-            writer.writerow(["Total Location/Corporate", total_loc])
-            writer.writerow(["Unique Location/Corporate", unique_loc])
-            writer.writerow(["Duplicate Location/Corporate", duplicate_loc])
-        writer.writerow([])
-        writer.writerow(["Status", "Count"])
-        for status, count in status_counts.items():
-            writer.writerow([status, count])
-        writer.writerow([])
-        writer.writerow(["Platform", "Count"])
-        for platform, count in platform_breakdown.items():
-            writer.writerow([platform, count])
+        csv.writer(handle).writerows(summary_rows)
 
     if args.unknowns_csv:
-        unknown_rows = [result for result in results_sorted if result["Status"] == "Unknown"]
-        with open(args.unknowns_csv, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(unknown_rows)
+        results_df[results_df["Status"] == "Unknown"].to_csv(args.unknowns_csv, index=False, encoding="utf-8")
     if args.inactive_csv:
-        inactive_rows = [result for result in results_sorted if result["Status"] == "Inactive"]
-        with open(args.inactive_csv, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(inactive_rows)
+        results_df[results_df["Status"] == "Inactive"].to_csv(args.inactive_csv, index=False, encoding="utf-8")
 
 
 # -------------------- CLI --------------------
@@ -494,6 +746,17 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--inactive-csv", default=None, help="Optional CSV of Inactive-only rows")
     parser.add_argument("--concurrency", type=int, default=16)
     parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument(
+        "--head-first",
+        action="store_true",
+        help="Probe with HEAD before GET so 404/410 pages never send a body (costs a round trip otherwise).",
+    )
+    parser.add_argument(
+        "--classify-workers",
+        type=int,
+        default=None,
+        help="Processes used to classify fetched pages (default: CPU count)",
+    )
     parser.add_argument("--url-col", default=None, help="Name of the URL column (auto-detect if omitted)")
     parser.add_argument("--location-col", default=None, help="Name of the Location/Corporate column")
     parser.add_argument(
@@ -0,0 +1,13 @@
+from pathlib import Path
+
+from hotel_social_discover.checkpoint import CheckpointStore
+
+
+def test_checkpoint_round_trip(tmp_path: Path):
+    path = tmp_path / "checkpoint.json"
+    store = CheckpointStore(path)
+    store.set("https://example.com", {"http_status": 200, "error_message": ""})
+    store.save()
+    assert not path.with_suffix(".json.tmp").exists()
+    reloaded = CheckpointStore(path)
+    assert reloaded.get("https://example.com") == {"http_status": 200, "error_message": ""}
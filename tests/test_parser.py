@@ -23,3 +23,22 @@ def test_parse_social_links_detects_platforms():
 
 def test_is_js_heavy_handles_short_content():
     assert parser.is_js_heavy("<html></html>")
+
+
+def test_detect_platform_uses_named_groups():
+    assert parser.detect_platform("https://youtu.be/abc") == "youtube"
+    assert parser.detect_platform("https://x.com/hotel") == "x"
+    assert parser.detect_platform("https://example.com") is None
+
+
+def test_parse_social_links_collapses_repeated_hrefs():
+    html = '<a href="/about">A</a><a href="https://facebook.com/h">F</a><a href="https://facebook.com/h">F</a>'
+    bucket, others = parser.parse_social_links(html, "https://example.com")
+    assert bucket["facebook"] == ["https://facebook.com/h"]
+    assert others == ["https://example.com/about"]
+
+
+def test_is_js_heavy_counts_scripts_when_anchors_are_scarce():
+    padding = "<p>" + "x" * 2_000 + "</p>"
+    assert parser.is_js_heavy(padding + "<SCRIPT></script>" * 21 + '<a href="/">home</a>')
+    assert not parser.is_js_heavy(padding + "<script></script>" * 21 + '<A href="/">a</A>' * 5)
@@ -0,0 +1,53 @@
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+
+from hotel_social_discover.checkpoint import CheckpointStore
+from hotel_social_discover.robots import RobotsManager
+
+
+def test_allowed_uses_fresh_persisted_robots(tmp_path: Path):
+    store = CheckpointStore(tmp_path / "robots.json")
+    store.set(
+        "https://example.com",
+        {"text": "User-agent: *\nDisallow: /private\n", "fetched_at": time.time()},
+    )
+    # No client: the rules can only come from the persisted copy.
+    robots = RobotsManager("test-agent", client=None, store=store)  # type: ignore[arg-type]
+
+    assert asyncio.run(robots.allowed("https://example.com/rooms"))
+    assert not asyncio.run(robots.allowed("https://example.com/private/page"))
+
+
+class _RobotsClient:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.requests = 0
+
+    async def get(self, url, timeout=None):
+        self.requests += 1
+        return httpx.Response(self.status_code, request=httpx.Request("GET", url))
+
+
+def test_missing_robots_is_persisted_as_allow_all(tmp_path: Path):
+    store = CheckpointStore(tmp_path / "robots.json")
+    client = _RobotsClient(404)
+    robots = RobotsManager("test-agent", client=client, store=store)  # type: ignore[arg-type]
+
+    assert asyncio.run(robots.allowed("https://example.com/rooms"))
+    assert store.get("https://example.com")["text"] == ""
+
+    # A new manager (next run) answers from the negative entry without refetching.
+    robots = RobotsManager("test-agent", client=client, store=store)  # type: ignore[arg-type]
+    assert asyncio.run(robots.allowed("https://example.com/private/page"))
+    assert client.requests == 1
+
+
+def test_server_error_is_not_persisted(tmp_path: Path):
+    store = CheckpointStore(tmp_path / "robots.json")
+    robots = RobotsManager("test-agent", client=_RobotsClient(503), store=store)  # type: ignore[arg-type]
+
+    assert asyncio.run(robots.allowed("https://example.com/rooms"))
+    assert store.get("https://example.com") is None
@@ -1,6 +1,13 @@
 from pathlib import Path
 
-from hotel_social_discover.storage import ResultRow, read_input_csv, write_output_csv
+from hotel_social_discover.storage import (
+    OUTPUT_COLUMNS,
+    ResultRow,
+    open_output_csv,
+    read_input_csv,
+    write_output_csv,
+    write_output_row,
+)
 
 
 def test_read_input_csv(tmp_path: Path):
@@ -10,6 +17,22 @@ def test_read_input_csv(tmp_path: Path):
     assert rows == [{"hotel_id": "1", "hotel_name": "Test Hotel", "url": "https://example.com"}]
 
 
+def test_read_input_csv_with_bom_keeps_ids_as_strings(tmp_path: Path):
+    csv_path = tmp_path / "input.csv"
+    csv_path.write_bytes("\ufeffhotel_id,hotel_name,url\n002,Test Hotel,https://example.com\n".encode("utf-8"))
+    rows = read_input_csv(csv_path)
+    assert rows == [{"hotel_id": "002", "hotel_name": "Test Hotel", "url": "https://example.com"}]
+
+
+def test_read_input_csv_tolerates_ragged_rows(tmp_path: Path):
+    csv_path = tmp_path / "input.csv"
+    csv_path.write_text("hotel_id,hotel_name,url\n1,Short Row\n2,Test Hotel,https://example.com\n")
+    rows = read_input_csv(csv_path)
+    assert [row["hotel_id"] for row in rows] == ["1", "2"]
+    assert rows[0]["url"] is None
+    assert rows[1]["url"] == "https://example.com"
+
+
 def test_write_output_csv(tmp_path: Path):
     output_path = tmp_path / "out.csv"
     row = ResultRow(hotel_id="1", hotel_name="Test Hotel", url="https://example.com")
@@ -17,3 +40,63 @@ def test_write_output_csv(tmp_path: Path):
     content = output_path.read_text().splitlines()
     assert content[0].startswith("hotel_id,hotel_name")
     assert "1" in content[1]
+
+
+def test_write_output_csv_stamps_rows_with_batch_timestamp(tmp_path: Path):
+    output_path = tmp_path / "out.csv"
+    rows = [
+        ResultRow(hotel_id="1", hotel_name="A", url="https://a.example"),
+        ResultRow(hotel_id="2", hotel_name="B", url="https://b.example", last_checked_utc_iso="2024-01-01T00:00:00+00:00"),
+    ]
+    write_output_csv(output_path, rows, timestamp="2025-06-01T12:00:00+00:00")
+    content = output_path.read_text().splitlines()
+    assert "2025-06-01T12:00:00+00:00" in content[1]
+    assert "2024-01-01T00:00:00+00:00" in content[2]
+
+
+def test_open_output_csv_streams_rows(tmp_path: Path):
+    output_path = tmp_path / "nested" / "out.csv"
+    with open_output_csv(output_path) as writer:
+        write_output_row(writer, ResultRow(hotel_id="1", hotel_name="A", url="https://a.example"))
+        write_output_row(writer, ResultRow(hotel_id="2", hotel_name="B", url="https://b.example"))
+    content = output_path.read_text().splitlines()
+    assert len(content) == 3
+    assert content[2].startswith("2,B,https://b.example")
+
+
+def test_result_row_round_trips_through_dict():
+    row = ResultRow(
+        hotel_id="1",
+        hotel_name="Test Hotel",
+        url="https://example.com",
+        http_status=200,
+        found_facebook=True,
+        facebook_url="https://facebook.com/test",
+        other_socials=["https://pinterest.com/test"],
+    )
+    restored = ResultRow.from_dict(row.to_dict(), hotel_id="2")
+    assert restored.hotel_id == "2"
+    assert restored.http_status == 200
+    assert restored.found_facebook and not restored.found_x
+    assert restored.facebook_url == "https://facebook.com/test"
+    assert restored.x_url is None
+    assert restored.other_socials == ["https://pinterest.com/test"]
+
+
+def test_to_dict_reflects_later_field_changes():
+    row = ResultRow(hotel_id="1", hotel_name="Test", url="https://example.com")
+    assert row.to_dict()["error_message"] == ""
+    row.error_message = "timeout"
+    assert row.to_dict()["error_message"] == "timeout"
+
+
+def test_to_row_matches_to_dict_column_order():
+    row = ResultRow(hotel_id="1", hotel_name="Test Hotel", url="https://example.com", found_x=True)
+    assert row.to_row() == tuple(row.to_dict()[column] for column in OUTPUT_COLUMNS)
+
+
+def test_write_output_csv_consumes_generator(tmp_path: Path):
+    output_path = tmp_path / "out.csv"
+    rows = (ResultRow(hotel_id=str(i), hotel_name="H", url="https://example.com") for i in range(3))
+    write_output_csv(output_path, rows)
+    assert len(output_path.read_text().splitlines()) == 4
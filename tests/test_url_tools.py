@@ -0,0 +1,33 @@
+import asyncio
+
+import httpx
+
+from hotel_social_discover.url_tools import resolve_redirects
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/hop":
+        return httpx.Response(301, headers={"location": "/final"})
+    if request.url.path == "/final":
+        return httpx.Response(302, headers={"location": "https://facebook.com/hotel"})
+    if request.url.path == "/no-head" and request.method == "HEAD":
+        return httpx.Response(405)
+    if request.url.path == "/no-head":
+        return httpx.Response(301, headers={"location": "https://x.com/hotel"})
+    return httpx.Response(200)
+
+
+def _resolve(url: str) -> str:
+    async def run() -> str:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            return await resolve_redirects(client, url)
+
+    return asyncio.run(run())
+
+
+def test_resolve_redirects_follows_chain():
+    assert _resolve("https://bit.ly/hop") == "https://facebook.com/hotel"
+
+
+def test_resolve_redirects_falls_back_to_get_when_head_rejected():
+    assert _resolve("https://bit.ly/no-head") == "https://x.com/hotel"